@@ -9,22 +9,104 @@ The CLI (python main.py ...) continues to work alongside this server
 since both share the same SQLite database.
 """
 
+import functools
 import os
+import queue
 import threading
 import webbrowser
-from flask import Flask, jsonify, request, render_template, abort
+import orjson
+from flask import Flask, Response, request, render_template, abort
 from apscheduler.schedulers.background import BackgroundScheduler
 
 import config
 import tracker
-import searcher
 
 app = Flask(__name__, template_folder="templates", static_folder="static")
-tracker.init_db()
+
+# ── Lazy startup work ─────────────────────────────────────────────────────────
+# Schema setup and the searcher import (which pulls in requests) happen on first
+# use instead of at import, so the server starts accepting connections sooner.
+_db_ready = False
+_db_lock = threading.Lock()
+
+
+def _ensure_db():
+    global _db_ready
+    if _db_ready:
+        return
+    with _db_lock:
+        if not _db_ready:
+            tracker.init_db()
+            _db_ready = True
+
+
+@app.before_request
+def _init_db_on_first_request():
+    _ensure_db()
+
+
+@functools.cache
+def _searcher():
+    import searcher
+    return searcher
+
+
+def _json(obj) -> Response:
+    """Serialize obj with orjson — much faster than jsonify on large job lists."""
+    return Response(orjson.dumps(obj), mimetype="application/json")
+
 
 # ── Search background state ────────────────────────────────────────────────────
+# _search_state is never mutated in place — writers swap in a new dict under
+# _search_lock, so readers can return it without locking.
 _search_state = {"running": False, "progress": "", "added": 0, "found": 0}
 _search_lock = threading.Lock()
+_search_queue: queue.Queue = queue.Queue()
+
+
+def _update_search_state(**changes) -> None:
+    global _search_state
+    with _search_lock:
+        _search_state = {**_search_state, **changes}
+
+
+def _claim_search(progress: str) -> bool:
+    """Mark a search as running. Returns False if one is already in progress."""
+    global _search_state
+    with _search_lock:
+        if _search_state["running"]:
+            return False
+        _search_state = {"running": True, "progress": progress, "added": 0, "found": 0}
+    return True
+
+
+def _search_worker():
+    """Single long-lived thread that runs queued searches one at a time."""
+    while True:
+        roles, error_label = _search_queue.get()
+        try:
+            _update_search_state(progress=f"Searching {len(roles)} role(s) across all sources...")
+            _ensure_db()
+            results = _searcher().search_all(
+                roles, progress=lambda msg: _update_search_state(progress=msg)
+            )
+
+            _update_search_state(progress=f"Found {len(results)} jobs, saving...")
+            added = tracker.save_jobs(results)
+
+            _update_search_state(
+                found=len(results),
+                added=added,
+                progress=f"Done! Found {len(results)}, {added} new.",
+                running=False,
+            )
+        except Exception as e:
+            _update_search_state(progress=f"{error_label}: {e}", running=False)
+        finally:
+            _search_queue.task_done()
+
+
+threading.Thread(target=_search_worker, name="search-worker", daemon=True).start()
 
 
 # ── SPA Shell ─────────────────────────────────────────────────────────────────
@@ -44,32 +126,24 @@ def api_jobs():
     is_remote = request.args.get("is_remote", "")
     source    = request.args.get("source", "").strip()
     limit     = int(request.args.get("limit", 200))
-    sort      = request.args.get("sort", "score")   # score | date | company
-
+    sort      = request.args.get("sort", "score")   # score | date | company | deadline
+
+    # Fast path for the default dashboard request: no filters, score order
+    if not (q or status or is_remote == "1" or source) and sort == "score":
+        return _json(tracker.get_jobs(limit=limit, min_score=min_score))
+
+    filters = {
+        "status":    status or None,
+        "is_remote": is_remote == "1",
+        "source":    source or None,
+        "sort":      sort,
+    }
     if q:
-        jobs = tracker.search_jobs_db(q)
+        jobs = tracker.search_jobs_db(q, limit=limit, min_score=min_score, **filters)
     else:
-        jobs = tracker.get_jobs(limit=limit, min_score=min_score)
-
-    # Client-side filtering that tracker.py doesn't support natively
-    if status:
-        jobs = [j for j in jobs if (j.get("app_status") or "saved") == status]
-    if is_remote == "1":
-        jobs = [j for j in jobs if j.get("is_remote")]
-    if source:
-        jobs = [j for j in jobs if (j.get("source") or "").lower() == source.lower()]
-
-    # Sort
-    if sort == "date":
-        jobs = sorted(jobs, key=lambda j: j.get("date_posted") or "", reverse=True)
-    elif sort == "company":
-        jobs = sorted(jobs, key=lambda j: (j.get("company") or "").lower())
-    elif sort == "deadline":
-        # Jobs with no deadline go to the end; soonest deadline first
-        jobs = sorted(jobs, key=lambda j: j.get("apply_deadline") or "9999-99-99")
-    # default: already sorted by score from tracker
+        jobs = tracker.get_jobs(limit=limit, min_score=min_score, **filters)
 
-    return jsonify(jobs)
+    return _json(jobs)
 
 
 @app.route("/api/jobs/<int:job_id>")
@@ -77,7 +151,7 @@ def api_job_detail(job_id):
     job = tracker.get_job(job_id)
     if not job:
         abort(404)
-    return jsonify(job)
+    return _json(job)
 
 
 @app.route("/api/jobs/<int:job_id>/status", methods=["POST"])
@@ -86,15 +160,15 @@ def api_set_status(job_id):
     status = data.get("status", "")
     notes  = data.get("notes", "")
 
-    if status not in tracker.VALID_STATUSES:
-        return jsonify({"error": f"Invalid status '{status}'"}), 400
+    if status not in tracker.VALID_STATUS_SET:
+        return _json({"error": f"Invalid status '{status}'"}), 400
 
     ok = tracker.set_status(job_id, status, notes)
     if not ok:
-        return jsonify({"error": "Failed to update"}), 500
+        return _json({"error": "Failed to update"}), 500
 
     job = tracker.get_job(job_id)
-    return jsonify({"ok": True, "status": status, "job": job})
+    return _json({"ok": True, "status": status, "job": job})
 
 
 @app.route("/api/jobs/<int:job_id>/notes", methods=["PATCH"])
@@ -109,16 +183,16 @@ def api_update_notes(job_id):
     current_status = job.get("app_status") or "saved"
     ok = tracker.set_status(job_id, current_status, notes)
     if not ok:
-        return jsonify({"error": "Failed to update notes"}), 500
+        return _json({"error": "Failed to update notes"}), 500
 
-    return jsonify({"ok": True})
+    return _json({"ok": True})
 
 
 # ── Stats ─────────────────────────────────────────────────────────────────────
 
 @app.route("/api/stats")
 def api_stats():
-    return jsonify(tracker.get_stats())
+    return _json(tracker.get_stats())
 
 
 # ── Applications ──────────────────────────────────────────────────────────────
@@ -127,16 +201,15 @@ def api_stats():
 def api_applications():
     status = request.args.get("status", "").strip() or None
     apps   = tracker.get_applications(status)
-    return jsonify(apps)
+    return _json(apps)
 
 
 # ── Config (for frontend to know roles/sources) ───────────────────────────────
 
 @app.route("/api/config")
 def api_config():
-    all_jobs = tracker.get_jobs(limit=9999, min_score=0)
-    sources  = sorted({j.get("source") or "" for j in all_jobs if j.get("source")})
-    return jsonify({
+    sources = tracker.get_distinct_sources()
+    return _json({
         "target_roles": config.TARGET_ROLES,
         "profile":      config.PROFILE,
         "statuses":     tracker.VALID_STATUSES,
@@ -148,71 +221,28 @@ def api_config():
 
 @app.route("/api/search", methods=["POST"])
 def api_search():
-    with _search_lock:
-        if _search_state["running"]:
-            return jsonify({"error": "Search already running"}), 409
-        _search_state["running"]  = True
-        _search_state["progress"] = "Starting search..."
-        _search_state["added"]    = 0
-        _search_state["found"]    = 0
+    if not _claim_search("Starting search..."):
+        return _json({"error": "Search already running"}), 409
 
-    # Read request data HERE — request context won't exist inside the thread
-    data = request.get_json(force=True, silent=True) or {}
-    role = data.get("role")
-
-    def _run(role):
-        try:
-            roles = [role] if role else config.TARGET_ROLES
-
-            _search_state["progress"] = f"Searching {len(roles)} role(s) across all sources..."
-            results = searcher.search_all(roles)
-
-            _search_state["progress"] = f"Found {len(results)} jobs, saving..."
-            added = tracker.save_jobs(results)
-
-            with _search_lock:
-                _search_state["found"]    = len(results)
-                _search_state["added"]    = added
-                _search_state["progress"] = f"Done! Found {len(results)}, {added} new."
-                _search_state["running"]  = False
-        except Exception as e:
-            with _search_lock:
-                _search_state["progress"] = f"Error: {e}"
-                _search_state["running"]  = False
-
-    t = threading.Thread(target=_run, args=(role,), daemon=True)
-    t.start()
-    return jsonify({"ok": True, "message": "Search started"})
+    data  = request.get_json(force=True, silent=True) or {}
+    role  = data.get("role")
+    roles = [role] if role else config.TARGET_ROLES
+    _search_queue.put_nowait((roles, "Error"))
+    return _json({"ok": True, "message": "Search started"})
 
 
 @app.route("/api/search/status")
 def api_search_status():
-    return jsonify(dict(_search_state))
+    return _json(_search_state)
 
 
 # ── Hourly scheduled search ───────────────────────────────────────────────────
 
 def _run_scheduled_search():
     """Runs automatically on a schedule — same logic as the manual search."""
-    with _search_lock:
-        if _search_state["running"]:
-            return  # already running, skip this tick
-        _search_state["running"]  = True
-        _search_state["progress"] = "Scheduled search running..."
-        _search_state["added"]    = 0
-        _search_state["found"]    = 0
-    try:
-        results = searcher.search_all(config.TARGET_ROLES)
-        added   = tracker.save_jobs(results)
-        with _search_lock:
-            _search_state["found"]    = len(results)
-            _search_state["added"]    = added
-            _search_state["progress"] = f"Done! Found {len(results)}, {added} new."
-            _search_state["running"]  = False
-    except Exception as e:
-        with _search_lock:
-            _search_state["progress"] = f"Scheduled search error: {e}"
-            _search_state["running"]  = False
+    if not _claim_search("Scheduled search running..."):
+        return  # already running, skip this tick
+    _search_queue.put_nowait((config.TARGET_ROLES, "Scheduled search error"))
 
 
 # ── Entry point ───────────────────────────────────────────────────────────────
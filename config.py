@@ -2,6 +2,10 @@
 Configuration for Ramya Sandadi's job search agent.
 """
 
+import os
+import re
+from collections import namedtuple
+
 # ── Profile ──────────────────────────────────────────────────────────────────
 PROFILE = {
     "name": "Ramya Sandadi",
@@ -20,7 +24,7 @@ PROFILE = {
 }
 
 # ── Target Roles ─────────────────────────────────────────────────────────────
-TARGET_ROLES = [
+TARGET_ROLES = (
     "UX UI Designer",
     "Product Designer",
     "Visual Designer",
@@ -28,10 +32,10 @@ TARGET_ROLES = [
     "Marketing Designer",
     "UX Researcher",
     "UX Designer",
-]
+)
 
 # ── Location Preferences ─────────────────────────────────────────────────────
-LOCATIONS = [
+LOCATIONS = (
     "Remote",
     "United States",
     "Seattle, WA",
@@ -42,10 +46,10 @@ LOCATIONS = [
     "Chicago, IL",
     "Boston, MA",
     "Portland, OR",
-]
+)
 
 # ── Keywords that match Ramya's skills (used to score relevance) ─────────────
-SKILL_KEYWORDS = [
+SKILL_KEYWORDS = (
     "figma", "adobe", "illustrator", "photoshop", "indesign",
     "wireframing", "prototyping", "user research", "usability testing",
     "accessibility", "data visualization", "design systems",
@@ -56,7 +60,7 @@ SKILL_KEYWORDS = [
     "canva", "squarespace", "wordpress",
     "social media", "seo", "digital marketing", "content strategy",
     "a/b testing", "analytics",
-]
+)
 
 # ── API Keys (add your free keys here for more results) ──────────────────────
 # JSearch: Sign up free at https://rapidapi.com/letscrape-6bRBa3QguO5/api/jsearch
@@ -73,21 +77,21 @@ THE_MUSE_API_KEY = ""
 # Job title must contain at least one of these to be kept.
 # This prevents "Software Engineer" etc. from slipping through when API
 # descriptions happen to mention "product", "visual", etc.
-RELEVANT_TITLE_KEYWORDS = [
+RELEVANT_TITLE_KEYWORDS = (
     "design", "designer", "user experience", "user interface",
     "product design", "visual design", "brand design",
     "creative", "graphic",
     "marketing design", "content design", "content strateg",
     "front-end", "frontend", "front end",
     "illustrat",  # illustrator / illustration
-]
+)
 # Short keywords (ux, ui) matched as whole words, not substrings
-RELEVANT_TITLE_KEYWORDS_WORD = ["ux", "ui"]
+RELEVANT_TITLE_KEYWORDS_WORD = ("ux", "ui")
 
 # ── Title exclusion filter ──────────────────────────────────────────────────
 # If a job title contains ANY of these, reject it even if it matches above.
 # This removes hardware designers, software engineers, recruiters, etc.
-EXCLUDED_TITLE_KEYWORDS = [
+EXCLUDED_TITLE_KEYWORDS = (
     "software engineer", "data engineer", "devops", "sre ",
     "backend", "fullstack", "full-stack", "full stack",
     "network engineer", "network asic", "asic ", "hardware",
@@ -106,12 +110,12 @@ EXCLUDED_TITLE_KEYWORDS = [
     "project manager", "program manager", "product manager",
     "copywriter", "copy editor",
     "photographer",
-]
+)
 
 # ── Seniority filter (based on ~4 years experience) ─────────────────────────
 # Jobs whose TITLE contains any of these words get a score penalty so they
 # sink below relevant results. They are NOT hidden — still visible if needed.
-OVERQUALIFIED_TITLE_KEYWORDS = [
+OVERQUALIFIED_TITLE_KEYWORDS = (
     "senior", "sr.",
     "principal",
     "staff",
@@ -121,7 +125,7 @@ OVERQUALIFIED_TITLE_KEYWORDS = [
     "vp ", "vice president",
     "manager",
     "associate director",
-]
+)
 # How many points to subtract per overqualified keyword found in the title
 OVERQUALIFIED_PENALTY = 20
 
@@ -129,44 +133,79 @@ OVERQUALIFIED_PENALTY = 20
 # Top tech & design companies with public job board APIs.
 # "ats" is the applicant tracking system: "greenhouse" or "lever".
 # "slug" is the company's board identifier.
-COMPANY_BOARDS = [
+CompanyBoard = namedtuple("CompanyBoard", "name ats slug")
+
+COMPANY_BOARDS = (
     # Design-forward companies
-    {"name": "Figma",        "ats": "greenhouse", "slug": "figma"},
-    {"name": "Canva",        "ats": "greenhouse", "slug": "canva"},
-    {"name": "Squarespace",  "ats": "greenhouse", "slug": "squarespace"},
-    {"name": "Webflow",      "ats": "greenhouse", "slug": "webflow"},
-    {"name": "Grammarly",    "ats": "greenhouse", "slug": "grammarly"},
-    {"name": "Duolingo",     "ats": "greenhouse", "slug": "duolingo"},
+    CompanyBoard("Figma",        "greenhouse", "figma"),
+    CompanyBoard("Canva",        "greenhouse", "canva"),
+    CompanyBoard("Squarespace",  "greenhouse", "squarespace"),
+    CompanyBoard("Webflow",      "greenhouse", "webflow"),
+    CompanyBoard("Grammarly",    "greenhouse", "grammarly"),
+    CompanyBoard("Duolingo",     "greenhouse", "duolingo"),
     # Big tech
-    {"name": "Stripe",       "ats": "greenhouse", "slug": "stripe"},
-    {"name": "Airbnb",       "ats": "greenhouse", "slug": "airbnb"},
-    {"name": "Spotify",      "ats": "lever",      "slug": "spotify"},
-    {"name": "Discord",      "ats": "greenhouse", "slug": "discord"},
-    {"name": "Dropbox",      "ats": "greenhouse", "slug": "dropbox"},
-    {"name": "Coinbase",     "ats": "greenhouse", "slug": "coinbase"},
-    {"name": "Cloudflare",   "ats": "greenhouse", "slug": "cloudflare"},
-    {"name": "Databricks",   "ats": "greenhouse", "slug": "databricks"},
-    {"name": "GitLab",       "ats": "greenhouse", "slug": "gitlab"},
-    {"name": "Roblox",       "ats": "greenhouse", "slug": "roblox"},
+    CompanyBoard("Stripe",       "greenhouse", "stripe"),
+    CompanyBoard("Airbnb",       "greenhouse", "airbnb"),
+    CompanyBoard("Spotify",      "lever",      "spotify"),
+    CompanyBoard("Discord",      "greenhouse", "discord"),
+    CompanyBoard("Dropbox",      "greenhouse", "dropbox"),
+    CompanyBoard("Coinbase",     "greenhouse", "coinbase"),
+    CompanyBoard("Cloudflare",   "greenhouse", "cloudflare"),
+    CompanyBoard("Databricks",   "greenhouse", "databricks"),
+    CompanyBoard("GitLab",       "greenhouse", "gitlab"),
+    CompanyBoard("Roblox",       "greenhouse", "roblox"),
     # Seattle / Bellevue area
-    {"name": "Twitch",       "ats": "greenhouse", "slug": "twitch"},
-    {"name": "LinkedIn",     "ats": "greenhouse", "slug": "linkedin"},
-    {"name": "Smartsheet",   "ats": "greenhouse", "slug": "smartsheet"},
-    {"name": "Okta",         "ats": "greenhouse", "slug": "okta"},
-    {"name": "DeepMind",     "ats": "greenhouse", "slug": "deepmind"},
+    CompanyBoard("Twitch",       "greenhouse", "twitch"),
+    CompanyBoard("LinkedIn",     "greenhouse", "linkedin"),
+    CompanyBoard("Smartsheet",   "greenhouse", "smartsheet"),
+    CompanyBoard("Okta",         "greenhouse", "okta"),
+    CompanyBoard("DeepMind",     "greenhouse", "deepmind"),
     # Growth-stage
-    {"name": "Intercom",     "ats": "greenhouse", "slug": "intercom"},
-    {"name": "Asana",        "ats": "greenhouse", "slug": "asana"},
-    {"name": "Brex",         "ats": "greenhouse", "slug": "brex"},
-    {"name": "Plaid",        "ats": "lever",      "slug": "plaid"},
-    {"name": "Robinhood",    "ats": "greenhouse", "slug": "robinhood"},
-    {"name": "Affirm",       "ats": "greenhouse", "slug": "affirm"},
-    {"name": "Gusto",        "ats": "greenhouse", "slug": "gusto"},
-    {"name": "Lyft",         "ats": "greenhouse", "slug": "lyft"},
-    {"name": "Instacart",    "ats": "greenhouse", "slug": "instacart"},
-    {"name": "Vercel",       "ats": "greenhouse", "slug": "vercel"},
-]
+    CompanyBoard("Intercom",     "greenhouse", "intercom"),
+    CompanyBoard("Asana",        "greenhouse", "asana"),
+    CompanyBoard("Brex",         "greenhouse", "brex"),
+    CompanyBoard("Plaid",        "lever",      "plaid"),
+    CompanyBoard("Robinhood",    "greenhouse", "robinhood"),
+    CompanyBoard("Affirm",       "greenhouse", "affirm"),
+    CompanyBoard("Gusto",        "greenhouse", "gusto"),
+    CompanyBoard("Lyft",         "greenhouse", "lyft"),
+    CompanyBoard("Instacart",    "greenhouse", "instacart"),
+    CompanyBoard("Vercel",       "greenhouse", "vercel"),
+)
 
 # ── Search Settings ──────────────────────────────────────────────────────────
 MAX_RESULTS_PER_SOURCE = 25
+SEARCH_WORKERS = 8  # concurrent HTTP requests while searching
+MAX_REQUESTS_PER_HOST = 4  # of those, how many may hit the same host at once
 DATABASE_PATH = "jobagent.db"
+# Per-source search results are cached on disk for this long (0 disables it).
+# The cache file lives next to this module, whatever directory we run from.
+SEARCH_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "search_cache.db")
+SEARCH_CACHE_TTL = 600  # seconds
+
+
+# ── Precompiled keyword matchers ────────────────────────────────────────────
+# Built once at import from the lists above so the searcher does one regex
+# scan per title/description instead of a Python loop over every keyword.
+# Patterns expect lowercased text; keywords are lowercased here too, so an
+# entry added above with capitals ("Figma") still matches.
+
+def _alternation(keywords: tuple[str, ...]) -> str:
+    # Longest first so e.g. "designer" wins over "design" at the same offset
+    lowered = {kw.lower() for kw in keywords}
+    return "|".join(re.escape(kw) for kw in sorted(lowered, key=lambda kw: (-len(kw), kw)))
+
+
+RELEVANT_TITLE_RE = re.compile(
+    _alternation(RELEVANT_TITLE_KEYWORDS)
+    + "|"
+    + "|".join(rf"\b{re.escape(kw.lower())}\b" for kw in RELEVANT_TITLE_KEYWORDS_WORD)
+)
+EXCLUDED_TITLE_RE = re.compile(_alternation(EXCLUDED_TITLE_KEYWORDS))
+OVERQUALIFIED_TITLE_RE = re.compile(_alternation(OVERQUALIFIED_TITLE_KEYWORDS))
+# Zero-width lookahead so overlapping skills ("graphic design systems") are all
+# found; findall() returns each matched keyword, count distinct ones for a score.
+SKILL_KEYWORDS_RE = re.compile(rf"(?=({_alternation(SKILL_KEYWORDS)}))")
+TARGET_ROLES_RE = re.compile(
+    rf"(?=({_alternation(TARGET_ROLES)}))"
+)
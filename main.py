@@ -17,24 +17,57 @@ Usage:
 """
 
 import csv
+import itertools
+import operator
+import os
 import webbrowser
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 
 import click
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
 
 import config
 import searcher
 import tracker
 
-console = Console()
+# Job titles and notes are printed verbatim, so don't turn ":name:" into emoji
+console = Console(emoji=False)
+
+# Subcommands that never touch the database, so cli() skips init_db for them
+_NO_DB_COMMANDS = frozenset({"links"})
+
+_STATUS_COLORS = {
+    "saved": "white",
+    "applied": "blue",
+    "followed_up": "yellow",
+    "interview": "green",
+    "offer": "bold green",
+    "rejected": "red",
+    "declined": "dim",
+    "withdrawn": "dim",
+}
+
+_EXPORT_FIELDNAMES = ("id", "title", "company", "location", "url", "date_posted",
+                      "source", "salary", "salary_min", "salary_max",
+                      "employment_type", "is_remote", "experience_level", "apply_deadline",
+                      "score", "app_status", "app_notes")
+# Pulls the export columns out of a job row in order, for a plain csv.writer
+_export_values = operator.itemgetter(*_EXPORT_FIELDNAMES)
 
 
 @click.group()
-def cli():
+@click.pass_context
+def cli(ctx):
     """Job Agent — Find and track design job applications."""
+    if ctx.invoked_subcommand in _NO_DB_COMMANDS:
+        return
     tracker.init_db()
+    # Every subcommand reuses the connection init_db opened; close it at the end
+    ctx.call_on_close(tracker.close)
 
 
 # ── Search ───────────────────────────────────────────────────────────────────
@@ -65,7 +98,7 @@ def search(role):
     console.print(f"\n[green]Found {len(results)} jobs, {added} new.[/]\n")
 
     # Display results
-    _display_jobs_table(results[:30])
+    _display_jobs_table(results, limit=30)
 
     console.print(f"\n[dim]Jobs saved to database. Use [bold]python main.py jobs[/bold] to view all saved jobs.[/]")
     console.print(f"[dim]Use [bold]python main.py apply <id>[/bold] to mark a job as applied.[/]")
@@ -103,8 +136,8 @@ def links(role, open_browser):
 def jobs(keyword, limit, min_score):
     """List saved jobs from the database."""
     if keyword:
-        results = tracker.search_jobs_db(keyword)
-        console.print(f"[cyan]Jobs matching '{keyword}':[/]\n")
+        results = tracker.search_jobs_db(keyword, limit=limit, min_score=min_score)
+        console.print(f"[cyan]Jobs matching '{keyword}' (top {limit}, min score {min_score}):[/]\n")
     else:
         results = tracker.get_jobs(limit=limit, min_score=min_score)
         console.print(f"[cyan]Saved jobs (top {limit}, min score {min_score}):[/]\n")
@@ -222,22 +255,11 @@ def track(filter_status):
     table.add_column("Title", style="bold", max_width=35)
     table.add_column("Company", style="cyan", max_width=20)
     table.add_column("Status", max_width=12)
-    table.add_column("Applied", max_width=12)
+    table.add_column("Applied", width=10)
     table.add_column("Notes", max_width=30)
 
-    status_colors = {
-        "saved": "white",
-        "applied": "blue",
-        "followed_up": "yellow",
-        "interview": "green",
-        "offer": "bold green",
-        "rejected": "red",
-        "declined": "dim",
-        "withdrawn": "dim",
-    }
-
     for app in apps:
-        color = status_colors.get(app["status"], "white")
+        color = _STATUS_COLORS.get(app["status"], "white")
         applied_date = (app.get("applied_at") or "")[:10]
         table.add_row(
             str(app["id"]),
@@ -253,22 +275,24 @@ def track(filter_status):
 
 # ── Re-extract deadlines & experience for existing jobs ─────────────────────
 
+# Below this many jobs, starting worker processes costs more than it saves
+_PARALLEL_EXTRACT_MIN_JOBS = 500
+
+
 @cli.command("update-details")
 def update_details():
     """Re-extract deadlines and experience level from saved job descriptions."""
-    all_jobs = tracker.get_jobs(limit=9999)
-    updated = 0
-    for job in all_jobs:
-        desc = job.get("description", "") or ""
-        deadline = searcher._extract_deadline(desc)
-        exp = searcher._extract_experience(f"{job['title']} {desc}")
-        if deadline or exp:
-            tracker.update_job_fields(job["id"], {
-                "apply_deadline": deadline,
-                "experience_level": exp,
-            })
-            updated += 1
-    console.print(f"[green]Updated details for {updated} jobs.[/]")
+    all_jobs = list(tracker.iter_job_texts())
+    # The regex work is CPU-bound, so spread large batches across processes
+    if len(all_jobs) >= _PARALLEL_EXTRACT_MIN_JOBS and (os.cpu_count() or 1) > 1:
+        with ProcessPoolExecutor() as pool:
+            results = list(pool.map(searcher._extract_details, all_jobs, chunksize=64))
+    else:
+        results = map(searcher._extract_details, all_jobs)
+    updates = [r for r in results if r[0] or r[1]]
+    # One transaction for all rows instead of a commit per job
+    tracker.update_job_details(updates)
+    console.print(f"[green]Updated details for {len(updates)} jobs.[/]")
 
 
 # ── Stats ────────────────────────────────────────────────────────────────────
@@ -299,26 +323,39 @@ def stats():
 @click.option("--output", "-o", default="jobs_export.csv", help="Output CSV filename")
 def export(output):
     """Export all saved jobs to a CSV file."""
-    all_jobs = tracker.get_jobs(limit=9999)
-    if not all_jobs:
+    # Stream rows from the DB straight into the CSV writer
+    all_jobs = tracker.iter_jobs()
+    first = next(all_jobs, None)
+    if first is None:
         console.print("[yellow]No jobs to export.[/]")
         return
 
-    fieldnames = ["id", "title", "company", "location", "url", "date_posted",
-                  "source", "salary", "salary_min", "salary_max",
-                  "employment_type", "is_remote", "experience_level", "apply_deadline",
-                  "score", "app_status", "app_notes"]
+    count = 0
     with open(output, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
-        writer.writeheader()
-        writer.writerows(all_jobs)
+        writer = csv.writer(f)
+        writer.writerow(_EXPORT_FIELDNAMES)
+        for job in itertools.chain((first,), all_jobs):
+            writer.writerow(_export_values(job))
+            count += 1
 
-    console.print(f"[green]Exported {len(all_jobs)} jobs to {output}[/]")
+    console.print(f"[green]Exported {count} jobs to {output}[/]")
 
 
 # ── Helpers ──────────────────────────────────────────────────────────────────
 
-def _display_jobs_table(jobs: list[dict]):
+# Built once and reused for every row instead of re-parsing markup per cell
+_EMP_TYPE_MAP = {"FULLTIME": "Full-time", "PARTTIME": "Part-time", "": ""}
+_REMOTE_CELL = Text("Remote", style="green")
+
+
+def _format_emp_type(emp_type: str) -> str:
+    label = _EMP_TYPE_MAP.get(emp_type)
+    if label is None:
+        label = emp_type.replace("FULLTIME", "Full-time").replace("PARTTIME", "Part-time")
+    return label
+
+
+def _display_jobs_table(jobs: Iterable[dict], limit: int | None = None):
     table = Table(show_lines=True)
     table.add_column("ID", style="dim", width=4)
     table.add_column("Score", style="magenta", width=5, justify="right")
@@ -331,11 +368,10 @@ def _display_jobs_table(jobs: list[dict]):
     table.add_column("Posted", max_width=11)
     table.add_column("Deadline", style="yellow", max_width=11)
 
-    for job in jobs:
+    for job in itertools.islice(jobs, limit):
         job_id = str(job.get("id", "—"))
-        remote = "[green]Remote[/]" if job.get("is_remote") else ""
-        location = remote or job.get("location", "")
-        emp_type = (job.get("employment_type") or "").replace("FULLTIME", "Full-time").replace("PARTTIME", "Part-time")
+        location = _REMOTE_CELL if job.get("is_remote") else job.get("location", "")
+        emp_type = _format_emp_type(job.get("employment_type") or "")
         table.add_row(
             job_id,
             str(job.get("score", 0)),
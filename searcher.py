@@ -3,71 +3,238 @@ Job search module — queries multiple free job APIs and scores results by relev
 Also generates direct search URLs for major job boards.
 """
 
+import functools
+import heapq
+import operator
 import re
+import sqlite3
+import threading
 import time
 import xml.etree.ElementTree as ET
-from urllib.parse import quote_plus
+from collections import namedtuple
+from contextlib import closing
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from email.utils import parsedate_to_datetime
+from urllib.parse import quote_plus, urlparse, urlsplit
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 import config
 
+# One session shared by every source and worker thread, so connections to the
+# same host are pooled and kept alive instead of re-handshaking per request.
+SESSION = requests.Session()
+SESSION.headers["User-Agent"] = "JobAgent/1.0"
+# Retry failed connection attempts (nothing was sent yet, so that is always
+# safe), but not read timeouts, so a slow API can't multiply its timeout.
+_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, connect=2, read=False, backoff_factor=0.3),
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
+# Searches run in parallel, so cap how many requests hit any one host at once
+# (e.g. all 7 roles querying Remotive, or the Greenhouse boards).
+_host_semaphores: dict[str, threading.BoundedSemaphore] = {}
+_host_semaphores_lock = threading.Lock()
+
+
+# Most sources download the same feed whatever the role (only JSearch and Adzuna
+# send the query), so during a search_all() run identical GETs share a single
+# request: the first caller fetches, concurrent and later callers wait for it.
+_shared_gets: dict[tuple, Future] | None = None
+_shared_gets_lock = threading.Lock()
+
+
+def _request_key(url: str, kwargs: dict) -> tuple:
+    return (url, *(
+        (k, tuple(sorted(v.items())) if isinstance(v, dict) else v)
+        for k, v in sorted(kwargs.items())
+    ))
+
+
+def _shared_fetch(key: tuple, fetch):
+    """Return fetch(), sharing one call per key while search_all() runs."""
+    shared = _shared_gets
+    if shared is None:
+        return fetch()
+    with _shared_gets_lock:
+        future = shared.get(key)
+        owner = future is None
+        if owner:
+            future = shared[key] = Future()
+    if owner:
+        try:
+            future.set_result(fetch())
+        except Exception as e:
+            future.set_exception(e)
+    return future.result()
+
+
+def _get(url: str, **kwargs) -> requests.Response:
+    """GET through the shared session (one request per URL during search_all)."""
+    return _shared_fetch(
+        ("get", *_request_key(url, kwargs)), lambda: _limited_get(url, **kwargs)
+    )
+
 
+def _get_json(url: str, **kwargs):
+    """GET a JSON feed and decode it, raising on HTTP errors.
+
+    During search_all() every caller gets the same decoded object, so the feed
+    is parsed once per run and its raw bytes are dropped right after. Callers
+    must treat the result as read-only.
+    """
+    def fetch():
+        resp = _limited_get(url, **kwargs)
+        resp.raise_for_status()
+        try:
+            # Parse the raw bytes directly; orjson is several times faster than
+            # resp.json() on multi-MB feeds and skips decoding .text first
+            return orjson.loads(resp.content)
+        except orjson.JSONDecodeError:
+            # e.g. NaN literals or a non-UTF-8 body, which the stdlib tolerates
+            return resp.json()
+
+    return _shared_fetch(("json", *_request_key(url, kwargs)), fetch)
+
+
+def _limited_get(url: str, **kwargs) -> requests.Response:
+    """GET through the shared session, limited per host to MAX_REQUESTS_PER_HOST."""
+    host = urlparse(url).netloc
+    with _host_semaphores_lock:
+        sem = _host_semaphores.get(host)
+        if sem is None:
+            sem = _host_semaphores[host] = threading.BoundedSemaphore(
+                config.MAX_REQUESTS_PER_HOST
+            )
+    with sem:
+        return SESSION.get(url, **kwargs)
+
+
+# Sort key for results. Each source keeps only its MAX_RESULTS_PER_SOURCE best
+# jobs, picked with heapq.nlargest rather than sorting the whole feed.
+_by_score = operator.itemgetter("score")
+
+# Compiled once at import; the extractors run for every job of every search.
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def _strip_tags(text: str) -> str:
+    """Remove HTML tags, skipping the regex entirely for plain-text fields."""
+    return _HTML_TAG_RE.sub("", text) if "<" in text else text
+
+
+# The scorer and extractors are pure functions of the job text, and the same
+# postings come back for several roles and sources in one search_all() run,
+# so their results are memoised (and cleared at the start of each run).
+_TEXT_CACHE_SIZE = 8192
+
+# Date formats a deadline may be written in: "February 20, 2026" / "02/20/2026"
+_MONTH_DATE = r"[A-Za-z]+\.?\s+\d{1,2},?\s+\d{4}"
+_NUMERIC_DATE = r"\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4}"
+
+# (lead-in, date formats) pairs; each combination is one deadline pattern
+_DEADLINE_FORMS = (
+    # "close on: 02/20/2026" / "close on: February 20, 2026"
+    (r"(?:apply|application|deadline|closes?|closing|due|window)\s+(?:\w+\s+){0,4}(?:by|before|on|date)[:\s]+\s*",
+     (_MONTH_DATE, _NUMERIC_DATE)),
+    # "application deadline: Feb 20, 2026"
+    (r"(?:application\s+(?:deadline|window)|closing\s+date|apply\s+by|posted\s+until)[:\s]+",
+     (_MONTH_DATE, _NUMERIC_DATE)),
+    # "expected to close on: 02/20/2026"
+    (r"expected\s+to\s+close\s+on[:\s]+",
+     (_NUMERIC_DATE, _MONTH_DATE)),
+)
+
+# In priority order; the first pattern that matches anywhere in the text wins
+_DEADLINE_PATTERNS = tuple(
+    re.compile(f"{lead}({date})", re.IGNORECASE)
+    for lead, dates in _DEADLINE_FORMS
+    for date in dates
+)
+
+
+def _fuse_deadline_forms() -> re.Pattern:
+    """All deadline patterns as one alternation, each lead-in shared by its date
+    formats. Named group p<i> marks which of _DEADLINE_PATTERNS matched."""
+    branches, i = [], 0
+    for lead, dates in _DEADLINE_FORMS:
+        alts = []
+        for date in dates:
+            alts.append(f"(?P<p{i}>{date})")
+            i += 1
+        branches.append(f"{lead}(?:{'|'.join(alts)})")
+    return re.compile("|".join(branches), re.IGNORECASE)
+
+
+_DEADLINE_ANY_RE = _fuse_deadline_forms()
+
+_EXPERIENCE_PATTERNS = (
+    (re.compile(r"(\d+)\+?\s*(?:to\s*\d+)?\s*years?\s+(?:of\s+)?experience"), lambda m: f"{m.group(1)}+ yrs"),
+    (re.compile(r"entry[\s-]level"), lambda m: "Entry Level"),
+    (re.compile(r"mid[\s-]level"), lambda m: "Mid Level"),
+    (re.compile(r"senior|sr\."), lambda m: "Senior"),
+    (re.compile(r"principal|staff|lead"), lambda m: "Principal/Staff"),
+    (re.compile(r"junior|jr\."), lambda m: "Junior"),
+)
+
+
+@functools.lru_cache(maxsize=_TEXT_CACHE_SIZE)
 def _extract_deadline(text: str) -> str:
     """Try to find an application deadline in job description text."""
-    patterns = [
-        # "close on: 02/20/2026" / "close on: February 20, 2026"
-        r"(?:apply|application|deadline|closes?|closing|due|window)\s+(?:\w+\s+){0,4}(?:by|before|on|date)[:\s]+\s*([A-Za-z]+\.?\s+\d{1,2},?\s+\d{4})",
-        r"(?:apply|application|deadline|closes?|closing|due|window)\s+(?:\w+\s+){0,4}(?:by|before|on|date)[:\s]+\s*(\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4})",
-        # "application deadline: Feb 20, 2026"
-        r"(?:application\s+(?:deadline|window)|closing\s+date|apply\s+by|posted\s+until)[:\s]+([A-Za-z]+\.?\s+\d{1,2},?\s+\d{4})",
-        r"(?:application\s+(?:deadline|window)|closing\s+date|apply\s+by|posted\s+until)[:\s]+(\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4})",
-        # "expected to close on: 02/20/2026"
-        r"expected\s+to\s+close\s+on[:\s]+(\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4})",
-        r"expected\s+to\s+close\s+on[:\s]+([A-Za-z]+\.?\s+\d{1,2},?\s+\d{4})",
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    # One scan of the fused pattern rules out the common no-deadline case and
+    # finds the leftmost match. That is the answer unless a higher-priority
+    # pattern also matches further along, so only those are checked again.
+    m = _DEADLINE_ANY_RE.search(text)
+    if m is None:
+        return ""
+    winner = int(m.lastgroup[1:])
+    for pattern in _DEADLINE_PATTERNS[:winner]:
+        match = pattern.search(text)
         if match:
             return match.group(1).strip()
-    return ""
+    return m.group(m.lastgroup).strip()
 
 
+@functools.lru_cache(maxsize=_TEXT_CACHE_SIZE)
 def _extract_experience(text: str) -> str:
     """Try to extract required experience level from job text."""
     text_lower = text.lower()
-    patterns = [
-        (r"(\d+)\+?\s*(?:to\s*\d+)?\s*years?\s+(?:of\s+)?experience", lambda m: f"{m.group(1)}+ yrs"),
-        (r"entry[\s-]level", lambda m: "Entry Level"),
-        (r"mid[\s-]level", lambda m: "Mid Level"),
-        (r"senior|sr\.", lambda m: "Senior"),
-        (r"principal|staff|lead", lambda m: "Principal/Staff"),
-        (r"junior|jr\.", lambda m: "Junior"),
-    ]
-    for pattern, formatter in patterns:
-        match = re.search(pattern, text_lower)
+    for pattern, formatter in _EXPERIENCE_PATTERNS:
+        match = pattern.search(text_lower)
         if match:
             return formatter(match)
     return ""
 
 
+def _extract_details(job: dict) -> tuple[str, str, int]:
+    """Return (apply_deadline, experience_level, id) for a saved job row.
+
+    Module-level so update-details can run it in worker processes.
+    """
+    desc = job["description"]
+    deadline = _extract_deadline(desc)
+    exp = _extract_experience(f"{job['title']} {desc}" if desc else job["title"])
+    return deadline, exp, job["id"]
+
+
+@functools.lru_cache(maxsize=_TEXT_CACHE_SIZE)
 def _score_job(title: str, description: str) -> int:
     """Score a job listing based on how well it matches Ramya's skills."""
     text = f"{title} {description}".lower()
-    score = 0
-    for kw in config.SKILL_KEYWORDS:
-        if kw in text:
-            score += 1
+    score = len(set(config.SKILL_KEYWORDS_RE.findall(text)))
     # Boost for exact role-title matches
     title_lower = title.lower()
-    for role in config.TARGET_ROLES:
-        if role.lower() in title_lower:
-            score += 10
+    score += 10 * len(set(config.TARGET_ROLES_RE.findall(title_lower)))
     # Penalise titles that are likely overqualified (~4 yrs experience)
-    for kw in config.OVERQUALIFIED_TITLE_KEYWORDS:
-        if kw in title_lower:
-            score -= config.OVERQUALIFIED_PENALTY
-            break  # one penalty max per job
+    if config.OVERQUALIFIED_TITLE_RE.search(title_lower):
+        score -= config.OVERQUALIFIED_PENALTY  # one penalty max per job
     return score
 
 
@@ -75,16 +242,51 @@ def _is_relevant_title(title: str) -> bool:
     """Return True if the job title contains at least one design-related keyword
     and none of the excluded keywords."""
     title_lower = title.lower()
-    if any(ex in title_lower for ex in config.EXCLUDED_TITLE_KEYWORDS):
+    if config.EXCLUDED_TITLE_RE.search(title_lower):
         return False
-    # Substring match for longer keywords
-    if any(kw in title_lower for kw in config.RELEVANT_TITLE_KEYWORDS):
-        return True
-    # Whole-word match for short keywords (ux, ui) to avoid false positives
-    for kw in config.RELEVANT_TITLE_KEYWORDS_WORD:
-        if re.search(rf"\b{kw}\b", title_lower):
-            return True
-    return False
+    # Substring match for longer keywords, whole-word match for ux/ui
+    return config.RELEVANT_TITLE_RE.search(title_lower) is not None
+
+
+# Locations that clearly mean US, remote or worldwide. All of these are plain
+# substring tests, folded into one regex scan each.
+_US_INDICATORS = (
+    "united states", "usa", "u.s.", "us ",
+    "remote", "anywhere", "worldwide", "global", "north america",
+)
+# US states (abbreviations after comma, e.g. "Seattle, WA")
+_US_STATE_CODES = (
+    "al", "ak", "az", "ar", "ca", "co", "ct", "de",
+    "fl", "ga", "hi", "id", "il", "in", "ia", "ks",
+    "ky", "la", "me", "md", "ma", "mi", "mn", "ms",
+    "mo", "mt", "ne", "nv", "nh", "nj", "nm", "ny",
+    "nc", "nd", "oh", "ok", "or", "pa", "ri", "sc",
+    "sd", "tn", "tx", "ut", "vt", "va", "wa", "wv",
+    "wi", "wy", "dc",
+)
+_NON_US_LOCATIONS = (
+    "romania", "germany", "india", "uk", "united kingdom", "canada",
+    "brazil", "france", "spain", "italy", "netherlands", "australia",
+    "poland", "portugal", "mexico", "argentina", "colombia", "chile",
+    "japan", "china", "korea", "singapore", "israel", "turkey",
+    "sweden", "norway", "denmark", "finland", "ireland", "austria",
+    "switzerland", "belgium", "czech", "hungary", "ukraine", "russia",
+    "philippines", "indonesia", "vietnam", "thailand", "malaysia",
+    "south africa", "nigeria", "kenya", "egypt", "pakistan",
+    "new zealand", "europe", "asia", "africa", "latin america",
+    "emea", "apac",
+    # Common non-US cities
+    "london", "dublin", "toronto", "vancouver", "montreal",
+    "berlin", "munich", "paris", "amsterdam", "barcelona",
+    "tokyo", "bangalore", "hyderabad", "mumbai", "pune",
+    "tel aviv", "são paulo", "sao paulo", "sydney", "melbourne",
+    "copenhagen",
+)
+_US_LOCATION_RE = re.compile(
+    "|".join(map(re.escape, _US_INDICATORS))
+    + "|, (?:" + "|".join(_US_STATE_CODES) + ")"
+)
+_NON_US_LOCATION_RE = re.compile("|".join(map(re.escape, _NON_US_LOCATIONS)))
 
 
 def _is_us_location(location: str) -> bool:
@@ -92,61 +294,42 @@ def _is_us_location(location: str) -> bool:
     loc = location.lower().strip()
     if not loc:
         return True  # missing location — keep it
-    us_indicators = [
-        "united states", "usa", "u.s.", "us ",
-        "remote", "anywhere", "worldwide", "global", "north america",
-        # US states (abbreviations after comma, e.g. "Seattle, WA")
-        ", al", ", ak", ", az", ", ar", ", ca", ", co", ", ct", ", de",
-        ", fl", ", ga", ", hi", ", id", ", il", ", in", ", ia", ", ks",
-        ", ky", ", la", ", me", ", md", ", ma", ", mi", ", mn", ", ms",
-        ", mo", ", mt", ", ne", ", nv", ", nh", ", nj", ", nm", ", ny",
-        ", nc", ", nd", ", oh", ", ok", ", or", ", pa", ", ri", ", sc",
-        ", sd", ", tn", ", tx", ", ut", ", vt", ", va", ", wa", ", wv",
-        ", wi", ", wy", ", dc",
-    ]
     # Quick pass for obvious US / remote
-    if any(indicator in loc for indicator in us_indicators):
+    if _US_LOCATION_RE.search(loc):
         return True
-    # Reject locations that name a non-US country
-    non_us = [
-        "romania", "germany", "india", "uk", "united kingdom", "canada",
-        "brazil", "france", "spain", "italy", "netherlands", "australia",
-        "poland", "portugal", "mexico", "argentina", "colombia", "chile",
-        "japan", "china", "korea", "singapore", "israel", "turkey",
-        "sweden", "norway", "denmark", "finland", "ireland", "austria",
-        "switzerland", "belgium", "czech", "hungary", "ukraine", "russia",
-        "philippines", "indonesia", "vietnam", "thailand", "malaysia",
-        "south africa", "nigeria", "kenya", "egypt", "pakistan",
-        "new zealand", "europe", "asia", "africa", "latin america",
-        "emea", "apac",
-        # Common non-US cities
-        "london", "dublin", "toronto", "vancouver", "montreal",
-        "berlin", "munich", "paris", "amsterdam", "barcelona",
-        "tokyo", "bangalore", "hyderabad", "mumbai", "pune",
-        "tel aviv", "são paulo", "sao paulo", "sydney", "melbourne",
-        "denmark", "copenhagen",
-    ]
-    if any(country in loc for country in non_us):
-        return False
+    # Reject locations that name a non-US country.
     # If we can't tell, keep it (could be a city name we don't recognise)
-    return True
+    return not _NON_US_LOCATION_RE.search(loc)
+
+
+_Query = namedtuple("_Query", "compact long_terms short_terms")
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_query(query: str) -> _Query:
+    """Split a query into the parts _matches_query tests, once per distinct query."""
+    query_lower = query.lower()
+    # Match on any word with 3+ chars (skip 'ux', 'ui' — handle those separately)
+    words = query_lower.split()
+    return _Query(
+        compact=query_lower.replace(" ", ""),
+        long_terms=tuple(w for w in words if len(w) > 2),
+        short_terms=frozenset(w for w in words if len(w) <= 2),
+    )
 
 
 def _matches_query(text: str, query: str) -> bool:
     """Check if text matches the query — at least one meaningful word must appear."""
+    q = _compile_query(query)
     text_lower = text.lower()
-    # Match on any word with 3+ chars (skip 'ux', 'ui' — handle those separately)
-    words = query.lower().split()
-    short_terms = [w for w in words if len(w) <= 2]
-    long_terms = [w for w in words if len(w) > 2]
-    # Check compound terms like "ux/ui", "ux designer"
-    if query.lower().replace(" ", "") in text_lower.replace(" ", "").replace("/", ""):
-        return True
-    if any(w in text_lower for w in long_terms):
+    # Plain substring tests first: most matches end here, before the copies below
+    if any(w in text_lower for w in q.long_terms):
         return True
-    if any(w in text_lower.split() for w in short_terms):
+    # Check compound terms like "ux/ui", "ux designer"
+    if q.compact in text_lower.replace(" ", "").replace("/", ""):
         return True
-    return False
+    # Short terms must be whole words: one split, hashed lookups against them
+    return bool(q.short_terms) and not q.short_terms.isdisjoint(text_lower.split())
 
 
 # ── Source: Remotive (free, no key, remote jobs) ─────────────────────────────
@@ -157,9 +340,7 @@ def search_remotive(query: str) -> list[dict]:
     # Fetch all jobs (no limit) and filter client-side
     params = {}
     try:
-        resp = requests.get(url, params=params, timeout=15)
-        resp.raise_for_status()
-        data = resp.json()
+        data = _get_json(url, params=params, timeout=15)
     except Exception as e:
         print(f"  [Remotive] Error: {e}")
         return []
@@ -167,6 +348,8 @@ def search_remotive(query: str) -> list[dict]:
     results = []
     for job in data.get("jobs", []):
         title = job.get("title", "")
+        if not _is_relevant_title(title):
+            continue
         desc = job.get("description", "")
         category = job.get("category", "").lower()
         tags = " ".join(job.get("tags", []))
@@ -183,7 +366,7 @@ def search_remotive(query: str) -> list[dict]:
         if not _is_us_location(location):
             continue
 
-        clean_desc = re.sub(r"<[^>]+>", "", desc)
+        clean_desc = _strip_tags(desc)
         results.append({
             "title": title,
             "company": job.get("company_name", ""),
@@ -201,9 +384,7 @@ def search_remotive(query: str) -> list[dict]:
             "description": clean_desc[:1000],
             "score": _score_job(title, desc),
         })
-    return sorted(results, key=lambda x: x["score"], reverse=True)[
-        : config.MAX_RESULTS_PER_SOURCE
-    ]
+    return heapq.nlargest(config.MAX_RESULTS_PER_SOURCE, results, key=_by_score)
 
 
 # ── Source: RemoteOK (free, no key) ──────────────────────────────────────────
@@ -211,11 +392,8 @@ def search_remotive(query: str) -> list[dict]:
 def search_remoteok(query: str) -> list[dict]:
     """Search RemoteOK for remote jobs."""
     url = "https://remoteok.com/api"
-    headers = {"User-Agent": "JobAgent/1.0"}
     try:
-        resp = requests.get(url, headers=headers, timeout=15)
-        resp.raise_for_status()
-        data = resp.json()
+        data = _get_json(url, timeout=15)
     except Exception as e:
         print(f"  [RemoteOK] Error: {e}")
         return []
@@ -226,6 +404,8 @@ def search_remoteok(query: str) -> list[dict]:
         if not isinstance(job, dict):
             continue
         title = job.get("position", "")
+        if not _is_relevant_title(title):
+            continue
         desc = job.get("description", "")
         tags = " ".join(job.get("tags", []))
         combined = f"{title} {desc} {tags}"
@@ -234,7 +414,7 @@ def search_remoteok(query: str) -> list[dict]:
         location = job.get("location", "Remote")
         if not _is_us_location(location):
             continue
-        clean_desc = re.sub(r"<[^>]+>", "", desc) if desc else ""
+        clean_desc = _strip_tags(desc) if desc else ""
         results.append({
             "title": title,
             "company": job.get("company", ""),
@@ -252,9 +432,7 @@ def search_remoteok(query: str) -> list[dict]:
             "description": clean_desc[:1000],
             "score": _score_job(title, desc or ""),
         })
-    return sorted(results, key=lambda x: x["score"], reverse=True)[
-        : config.MAX_RESULTS_PER_SOURCE
-    ]
+    return heapq.nlargest(config.MAX_RESULTS_PER_SOURCE, results, key=_by_score)
 
 
 # ── Source: The Muse (free, optional key) ────────────────────────────────────
@@ -271,9 +449,7 @@ def search_themuse(query: str) -> list[dict]:
         if config.THE_MUSE_API_KEY:
             params["api_key"] = config.THE_MUSE_API_KEY
         try:
-            resp = requests.get(url, params=params, timeout=15)
-            resp.raise_for_status()
-            data = resp.json()
+            data = _get_json(url, params=params, timeout=15)
         except Exception:
             break  # stop paginating this category on error
 
@@ -283,6 +459,8 @@ def search_themuse(query: str) -> list[dict]:
 
         for job in jobs:
             title = job.get("name", "")
+            if not _is_relevant_title(title):
+                continue
             company = job.get("company", {}).get("name", "")
             desc = job.get("contents", "")
             locations = ", ".join(
@@ -293,7 +471,7 @@ def search_themuse(query: str) -> list[dict]:
                 continue
             if not _is_us_location(locations):
                 continue
-            clean_desc = re.sub(r"<[^>]+>", "", desc)
+            clean_desc = _strip_tags(desc)
             levels = [lv.get("name", "") for lv in job.get("levels", [])]
             all_results.append({
                 "title": title,
@@ -312,9 +490,7 @@ def search_themuse(query: str) -> list[dict]:
                 "description": clean_desc[:1000],
                 "score": _score_job(title, desc),
             })
-    return sorted(all_results, key=lambda x: x["score"], reverse=True)[
-        : config.MAX_RESULTS_PER_SOURCE
-    ]
+    return heapq.nlargest(config.MAX_RESULTS_PER_SOURCE, all_results, key=_by_score)
 
 
 # ── Source: Jobicy (free, no key, remote jobs) ───────────────────────────────
@@ -325,9 +501,7 @@ def search_jobicy(query: str) -> list[dict]:
     params = {"count": 50}
     headers = {"User-Agent": "Mozilla/5.0 (JobAgent/1.0)"}
     try:
-        resp = requests.get(url, params=params, headers=headers, timeout=15)
-        resp.raise_for_status()
-        data = resp.json()
+        data = _get_json(url, params=params, headers=headers, timeout=15)
     except Exception as e:
         print(f"  [Jobicy] Error: {e}")
         return []
@@ -335,6 +509,8 @@ def search_jobicy(query: str) -> list[dict]:
     results = []
     for job in data.get("jobs", []):
         title = job.get("jobTitle", "")
+        if not _is_relevant_title(title):
+            continue
         desc = job.get("jobDescription", "")
         industry = job.get("jobIndustry", [])
         industry_str = " ".join(industry) if isinstance(industry, list) else str(industry)
@@ -346,7 +522,7 @@ def search_jobicy(query: str) -> list[dict]:
         if not _is_us_location(geo):
             continue
 
-        clean_desc = re.sub(r"<[^>]+>", "", desc) if desc else ""
+        clean_desc = _strip_tags(desc) if desc else ""
         sal_min = str(job.get("annualSalaryMin", ""))
         sal_max = str(job.get("annualSalaryMax", ""))
         results.append({
@@ -366,9 +542,7 @@ def search_jobicy(query: str) -> list[dict]:
             "description": clean_desc[:1000],
             "score": _score_job(title, desc or ""),
         })
-    return sorted(results, key=lambda x: x["score"], reverse=True)[
-        : config.MAX_RESULTS_PER_SOURCE
-    ]
+    return heapq.nlargest(config.MAX_RESULTS_PER_SOURCE, results, key=_by_score)
 
 
 # ── Source: Himalayas (free, no key, remote jobs) ────────────────────────────
@@ -380,9 +554,7 @@ def search_himalayas(query: str) -> list[dict]:
     for offset in range(0, 100, 20):  # pages of 20, up to 100 jobs
         params = {"limit": 20, "offset": offset}
         try:
-            resp = requests.get(url, params=params, timeout=15)
-            resp.raise_for_status()
-            data = resp.json()
+            data = _get_json(url, params=params, timeout=15)
         except Exception as e:
             if offset == 0:
                 print(f"  [Himalayas] Error: {e}")
@@ -394,6 +566,8 @@ def search_himalayas(query: str) -> list[dict]:
 
         for job in jobs:
             title = job.get("title", "")
+            if not _is_relevant_title(title):
+                continue
             desc = job.get("description", "")
             categories = " ".join(job.get("categories", []))
             combined = f"{title} {desc} {categories}"
@@ -404,7 +578,7 @@ def search_himalayas(query: str) -> list[dict]:
             if not _is_us_location(location):
                 continue
 
-            clean_desc = re.sub(r"<[^>]+>", "", desc) if desc else ""
+            clean_desc = _strip_tags(desc) if desc else ""
             sal_min = str(job.get("minSalary", ""))
             sal_max = str(job.get("maxSalary", ""))
             results.append({
@@ -424,9 +598,7 @@ def search_himalayas(query: str) -> list[dict]:
                 "description": clean_desc[:1000],
                 "score": _score_job(title, desc or ""),
             })
-    return sorted(results, key=lambda x: x["score"], reverse=True)[
-        : config.MAX_RESULTS_PER_SOURCE
-    ]
+    return heapq.nlargest(config.MAX_RESULTS_PER_SOURCE, results, key=_by_score)
 
 
 # ── Source: JSearch / RapidAPI (free tier — needs key) ───────────────────────
@@ -448,18 +620,16 @@ def search_jsearch(query: str) -> list[dict]:
         "remote_jobs_only": "false",
     }
     try:
-        resp = requests.get(url, headers=headers, params=params, timeout=60)
-        if resp.status_code == 403:
-            # Silently skip if not subscribed
-            return []
-        resp.raise_for_status()
-        data = resp.json()
+        # A 403 (not subscribed) raises here too and is silently skipped
+        data = _get_json(url, headers=headers, params=params, timeout=60)
     except Exception as e:
         return []
 
     results = []
     for job in data.get("data", []):
         title = job.get("job_title", "")
+        if not _is_relevant_title(title):
+            continue
         desc = job.get("job_description", "")
         city = job.get("job_city", "") or ""
         state = job.get("job_state", "") or ""
@@ -496,9 +666,7 @@ def search_jsearch(query: str) -> list[dict]:
             "description": (desc or "")[:1000],
             "score": _score_job(title, desc or ""),
         })
-    return sorted(results, key=lambda x: x["score"], reverse=True)[
-        : config.MAX_RESULTS_PER_SOURCE
-    ]
+    return heapq.nlargest(config.MAX_RESULTS_PER_SOURCE, results, key=_by_score)
 
 
 # ── Source: Adzuna (free tier — needs key) ───────────────────────────────────
@@ -519,9 +687,7 @@ def search_adzuna(query: str) -> list[dict]:
             f"&content-type=application/json"
         )
         try:
-            resp = requests.get(url, timeout=15)
-            resp.raise_for_status()
-            data = resp.json()
+            data = _get_json(url, timeout=15)
         except Exception as e:
             if page == 1:
                 print(f"  [Adzuna] Error: {e}")
@@ -533,13 +699,16 @@ def search_adzuna(query: str) -> list[dict]:
 
         for job in jobs:
             title = job.get("title", "")
+            clean_title = _strip_tags(title)
+            if not _is_relevant_title(clean_title):
+                continue
             desc = job.get("description", "")
-            clean_desc = re.sub(r"<[^>]+>", "", desc)
+            clean_desc = _strip_tags(desc)
             sal_min = job.get("salary_min")
             sal_max = job.get("salary_max")
             salary_str = f"${sal_min:,.0f}-${sal_max:,.0f}" if sal_min and sal_max else ""
             results.append({
-                "title": re.sub(r"<[^>]+>", "", title),
+                "title": clean_title,
                 "company": job.get("company", {}).get("display_name", ""),
                 "location": job.get("location", {}).get("display_name", ""),
                 "url": job.get("redirect_url", ""),
@@ -555,9 +724,7 @@ def search_adzuna(query: str) -> list[dict]:
                 "description": clean_desc[:1000],
                 "score": _score_job(title, desc),
             })
-    return sorted(results, key=lambda x: x["score"], reverse=True)[
-        : config.MAX_RESULTS_PER_SOURCE
-    ]
+    return heapq.nlargest(config.MAX_RESULTS_PER_SOURCE, results, key=_by_score)
 
 
 # ── Source: We Work Remotely (free, RSS, design category) ────────────────────
@@ -566,21 +733,26 @@ def search_weworkremotely(query: str) -> list[dict]:
     """Search We Work Remotely design category via RSS feed."""
     url = "https://weworkremotely.com/categories/remote-design-jobs.rss"
     try:
-        resp = requests.get(url, timeout=15)
+        resp = _get(url, timeout=15)
         resp.raise_for_status()
-        root = ET.fromstring(resp.text)
+        # Parse the raw bytes: the parser reads the feed's declared encoding
+        # itself, so requests never has to decode (or guess the charset of) .text
+        root = ET.fromstring(resp.content)
     except Exception as e:
         print(f"  [WWR] Error: {e}")
         return []
 
     results = []
-    for item in root.findall(".//item"):
+    for item in root.iterfind(".//item"):
         raw_title = item.findtext("title", "")
         # Title format is "Company: Job Title"
         if ": " in raw_title:
             company, title = raw_title.split(": ", 1)
         else:
             company, title = "", raw_title
+        title = title.strip()
+        if not _is_relevant_title(title):
+            continue
 
         desc = item.findtext("description", "") or ""
         region = item.findtext("region", "") or ""
@@ -590,14 +762,13 @@ def search_weworkremotely(query: str) -> list[dict]:
         if not _is_us_location(region or "Remote"):
             continue
 
-        clean_desc = re.sub(r"<[^>]+>", "", desc)
+        clean_desc = _strip_tags(desc)
         link = item.findtext("link", "") or item.findtext("guid", "")
         pub_date = item.findtext("pubDate", "")
         # Parse "Thu, 26 Feb 2026 16:43:31 +0000" to "2026-02-26"
         date_posted = ""
         if pub_date:
             try:
-                from email.utils import parsedate_to_datetime
                 dt = parsedate_to_datetime(pub_date)
                 date_posted = dt.strftime("%Y-%m-%d")
             except Exception:
@@ -605,7 +776,7 @@ def search_weworkremotely(query: str) -> list[dict]:
 
         emp_type = item.findtext("type", "") or ""
         results.append({
-            "title": title.strip(),
+            "title": title,
             "company": company.strip(),
             "location": region or "Remote",
             "url": link,
@@ -621,9 +792,7 @@ def search_weworkremotely(query: str) -> list[dict]:
             "description": clean_desc[:1000],
             "score": _score_job(title, desc),
         })
-    return sorted(results, key=lambda x: x["score"], reverse=True)[
-        : config.MAX_RESULTS_PER_SOURCE
-    ]
+    return heapq.nlargest(config.MAX_RESULTS_PER_SOURCE, results, key=_by_score)
 
 
 # ── Source: Company Career Pages (Greenhouse + Lever, free, no key) ──────────
@@ -632,9 +801,7 @@ def _fetch_greenhouse_jobs(slug: str) -> list[dict]:
     """Fetch all jobs from a Greenhouse board."""
     url = f"https://boards-api.greenhouse.io/v1/boards/{slug}/jobs"
     try:
-        resp = requests.get(url, timeout=10)
-        resp.raise_for_status()
-        return resp.json().get("jobs", [])
+        return _get_json(url, timeout=10).get("jobs", [])
     except Exception:
         return []
 
@@ -643,25 +810,29 @@ def _fetch_lever_jobs(slug: str) -> list[dict]:
     """Fetch all jobs from a Lever board."""
     url = f"https://api.lever.co/v0/postings/{slug}"
     try:
-        resp = requests.get(url, timeout=10)
-        resp.raise_for_status()
-        data = resp.json()
+        data = _get_json(url, timeout=10)
         return data if isinstance(data, list) else []
     except Exception:
         return []
 
 
+def _fetch_board_jobs(board: config.CompanyBoard) -> list[dict]:
+    if board.ats == "greenhouse":
+        return _fetch_greenhouse_jobs(board.slug)
+    if board.ats == "lever":
+        return _fetch_lever_jobs(board.slug)
+    return []
+
+
 def search_company_boards(query: str) -> list[dict]:
     """Search career pages of top tech/design companies for design roles."""
     results = []
 
-    for board in config.COMPANY_BOARDS:
-        company_name = board["name"]
-        ats = board["ats"]
-        slug = board["slug"]
+    with ThreadPoolExecutor(max_workers=config.SEARCH_WORKERS) as pool:
+        board_jobs = list(pool.map(_fetch_board_jobs, config.COMPANY_BOARDS))
 
+    for (company_name, ats, _), raw_jobs in zip(config.COMPANY_BOARDS, board_jobs):
         if ats == "greenhouse":
-            raw_jobs = _fetch_greenhouse_jobs(slug)
             for job in raw_jobs:
                 title = job.get("title", "")
                 location = job.get("location", {}).get("name", "") if isinstance(job.get("location"), dict) else ""
@@ -690,7 +861,6 @@ def search_company_boards(query: str) -> list[dict]:
                 })
 
         elif ats == "lever":
-            raw_jobs = _fetch_lever_jobs(slug)
             for job in raw_jobs:
                 title = job.get("text", "")
                 cats = job.get("categories", {})
@@ -727,9 +897,7 @@ def search_company_boards(query: str) -> list[dict]:
                     "score": _score_job(title, ""),
                 })
 
-        time.sleep(0.2)  # be polite
-
-    return sorted(results, key=lambda x: x["score"], reverse=True)
+    return sorted(results, key=_by_score, reverse=True)
 
 
 # ── Main search orchestrator ─────────────────────────────────────────────────
@@ -746,38 +914,128 @@ ALL_SOURCES = [
 ]
 
 
-def search_all(roles: list[str] | None = None) -> list[dict]:
-    """Run searches across all sources for each target role. Returns deduplicated results."""
+# ── On-disk response cache ───────────────────────────────────────────────────
+# Results are cached per (source, role) for SEARCH_CACHE_TTL seconds so running
+# a search twice in a row doesn't re-hit every API. Only non-empty results are
+# cached: sources return [] on errors, and those shouldn't stick.
+
+@functools.cache
+def _init_search_cache() -> None:
+    """Create the cache table (once per process)."""
+    with closing(sqlite3.connect(config.SEARCH_CACHE_PATH, timeout=10)) as conn:
+        conn.execute("PRAGMA journal_mode=WAL")
+        # Older cache files declared payload TEXT; it's only a cache, so start over
+        if ("payload", "TEXT") in conn.execute(
+            "SELECT name, type FROM pragma_table_info('search_cache')"
+        ).fetchall():
+            conn.execute("DROP TABLE search_cache")
+        conn.execute(
+            """CREATE TABLE IF NOT EXISTS search_cache (
+                   source     TEXT NOT NULL,
+                   role       TEXT NOT NULL,
+                   expires_at REAL NOT NULL,
+                   payload    BLOB NOT NULL,  -- orjson-encoded result list
+                   PRIMARY KEY (source, role)
+               )"""
+        )
+
+
+def _cache_connect() -> sqlite3.Connection:
+    _init_search_cache()
+    return sqlite3.connect(config.SEARCH_CACHE_PATH, timeout=10)
+
+
+def _cached_search(source_name: str, search_fn, role: str) -> list[dict]:
+    """Call search_fn(role), reusing a cached result if it hasn't expired."""
+    if config.SEARCH_CACHE_TTL <= 0:
+        return search_fn(role)
+    # No connection is held open across the network fetch
+    with closing(_cache_connect()) as conn:
+        row = conn.execute(
+            "SELECT payload FROM search_cache WHERE source = ? AND role = ? AND expires_at > ?",
+            (source_name, role, time.time()),
+        ).fetchone()
+    if row:
+        return orjson.loads(row[0])
+    results = search_fn(role)
+    if results:
+        with closing(_cache_connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO search_cache VALUES (?, ?, ?, ?)",
+                (source_name, role, time.time() + config.SEARCH_CACHE_TTL,
+                 orjson.dumps(results)),
+            )
+    return results
+
+
+def _url_key(url: str) -> tuple[str, str, str]:
+    """Identity of a job URL for deduplication, so the same posting linked with
+    utm_* tracking parameters, a fragment, http vs https or a trailing slash is
+    only kept once. Other query parameters are kept: some boards put the job id
+    there (e.g. ?gh_jid=123)."""
+    parts = urlsplit(url)
+    query = "&".join(
+        p for p in parts.query.split("&") if p and not p.startswith("utm_")
+    )
+    return parts.netloc.lower(), parts.path.rstrip("/"), query
+
+
+def search_all(roles: list[str] | None = None, progress=None) -> list[dict]:
+    """Run searches across all sources for each target role. Returns deduplicated results.
+
+    Every (role, source) search runs concurrently on a thread pool. If given,
+    progress is called with a short status message as each one finishes.
+    """
+    global _shared_gets
     if roles is None:
         roles = config.TARGET_ROLES
 
+    for fn in (_score_job, _extract_deadline, _extract_experience):
+        fn.cache_clear()
+
+    _shared_gets = {}
+    try:
+        futures, career_future = _submit_searches(roles, progress)
+    finally:
+        _shared_gets = None
+
+    # Merge in submission order so deduplication stays deterministic
     seen_urls = set()
     all_results = []
-
-    # 1) Job board APIs — searched once per role
-    for role in roles:
-        for source_name, search_fn in ALL_SOURCES:
-            results = search_fn(role)
-            for job in results:
-                url = job.get("url", "")
-                if url and url not in seen_urls and _is_relevant_title(job.get("title", "")):
-                    seen_urls.add(url)
-                    all_results.append(job)
-            time.sleep(0.3)  # be polite to APIs
-
-    # 2) Company career pages — searched once (title filter is built-in)
-    career_jobs = search_company_boards("")
-    for job in career_jobs:
-        url = job.get("url", "")
-        if url and url not in seen_urls:
-            seen_urls.add(url)
-            all_results.append(job)
+    for results in [*(f.result() for f in futures), career_future.result()]:
+        for job in results:
+            url = job.get("url", "")
+            if not url:
+                continue
+            key = _url_key(url)
+            if key not in seen_urls:
+                seen_urls.add(key)
+                all_results.append(job)
 
     # Sort by score descending
-    all_results.sort(key=lambda x: x["score"], reverse=True)
+    all_results.sort(key=_by_score, reverse=True)
     return all_results
 
 
+def _submit_searches(roles: list[str], progress=None) -> tuple[list[Future], Future]:
+    """Run every (role, source) search plus the career-page search to completion."""
+    workers = min(config.SEARCH_WORKERS, len(roles) * len(ALL_SOURCES) + 1)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # 1) Job board APIs — searched once per role
+        futures = [
+            pool.submit(_cached_search, source_name, search_fn, role)
+            for role in roles
+            for source_name, search_fn in ALL_SOURCES
+        ]
+        # 2) Company career pages — searched once (title filter is built-in)
+        career_future = pool.submit(_cached_search, "Careers", search_company_boards, "")
+
+        if progress:
+            for done, _ in enumerate(as_completed(futures), 1):
+                progress(f"Searched {done}/{len(futures)} role/source combinations...")
+    return futures, career_future
+
+
 # ── Direct Search URL Generator ──────────────────────────────────────────────
 
 def generate_search_urls(role: str) -> list[dict]:
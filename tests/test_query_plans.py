@@ -0,0 +1,79 @@
+"""
+Guard the query plans of the hot tracker queries.
+
+Each test runs the real tracker function against a small temporary database,
+captures the SQL it executed, and checks EXPLAIN QUERY PLAN for a full scan of
+jobs/applications or a temp B-tree sort, so a schema change can't quietly turn
+an indexed query back into a scan.
+"""
+
+import re
+
+import pytest
+
+import tracker
+
+# "SCAN j", "SCAN a USING COVERING INDEX ..." etc.; jobs_fts is an index, not a scan
+_FULL_SCAN_RE = re.compile(r"^SCAN (j|a|jobs|applications)\b")
+
+
+@pytest.fixture
+def conn(tmp_path, monkeypatch):
+    tracker.close()
+    monkeypatch.setattr(tracker, "DB_PATH", tmp_path / "jobagent.db")
+    tracker._invalidate_jobs()
+    tracker.init_db()
+    tracker.save_jobs([
+        {
+            "title": f"Data Analyst {i}",
+            "company": f"Company {i % 7}",
+            "location": "Remote",
+            "url": f"https://example.com/jobs/{i}",
+            "date_posted": f"2026-01-{i % 28 + 1:02d}",
+            "source": ("Remotive", "Adzuna")[i % 2],
+            "description": "SQL, Python and dashboards",
+            "score": i % 100,
+        }
+        for i in range(200)
+    ])
+    tracker.set_statuses([
+        (job_id, ("saved", "applied", "interview")[job_id % 3], "")
+        for job_id in range(1, 60)
+    ])
+    yield tracker._connect()
+    tracker.close()
+
+
+def _executed_selects(conn, fn, *args, **kwargs) -> list[str]:
+    """Run fn and return the SELECT statements it sent, with parameters bound."""
+    statements = []
+    conn.set_trace_callback(statements.append)
+    try:
+        fn(*args, **kwargs)
+    finally:
+        conn.set_trace_callback(None)
+    selects = [s for s in statements if s.lstrip().startswith("SELECT")]
+    assert selects, f"{fn.__name__} ran no SELECT"
+    return selects
+
+
+def _assert_indexed(conn, sql: str) -> None:
+    plan = [row["detail"] for row in conn.execute("EXPLAIN QUERY PLAN " + sql)]
+    for detail in plan:
+        assert not _FULL_SCAN_RE.match(detail), f"full scan in {plan}\n{sql}"
+        assert "TEMP B-TREE" not in detail, f"temp sort in {plan}\n{sql}"
+
+
+def test_get_jobs_walks_score_index(conn):
+    for sql in _executed_selects(conn, tracker.get_jobs, limit=50, min_score=10):
+        _assert_indexed(conn, sql)
+
+
+def test_get_applications_by_status_uses_status_index(conn):
+    for sql in _executed_selects(conn, tracker.get_applications, "applied"):
+        _assert_indexed(conn, sql)
+
+
+def test_search_jobs_db_uses_fts_index(conn):
+    for sql in _executed_selects(conn, tracker.search_jobs_db, "analyst", limit=50):
+        _assert_indexed(conn, sql)
@@ -2,7 +2,11 @@
 Application tracker — SQLite-backed database to track job applications.
 """
 
+import functools
 import sqlite3
+import threading
+import time
+from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
 from urllib.parse import urlparse, urlunparse
@@ -12,16 +16,75 @@ import config
 DB_PATH = Path(config.DATABASE_PATH)
 
 
+# Per-connection tuning. journal_mode=WAL is persistent, so init_db sets it once.
+_CONNECTION_PRAGMAS = """
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA mmap_size=268435456;
+    PRAGMA cache_size=-65536;
+    PRAGMA analysis_limit=1000;
+"""
+
+# Refresh the planner statistics (sqlite_stat1) after a save adds this many rows
+ANALYZE_MIN_NEW_ROWS = 100
+
+# One connection per thread, opened lazily and reused for every call on it.
+_local = threading.local()
+
+# get_jobs/search_jobs_db build their SQL from the filter, sort and limit
+# options, which gives a couple of hundred distinct statements. Keep them all
+# prepared (sqlite3 caches 128 by default, keyed on the SQL text).
+_CACHED_STATEMENTS = 256
+
+
+def close() -> None:
+    """Close this thread's connection, if one is open."""
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        conn.close()
+        _local.conn = None
+
+
+def _dict_row(cursor: sqlite3.Cursor, row: tuple) -> dict:
+    """Row factory that builds plain dicts directly, skipping the sqlite3.Row
+    copy (dict(Row) looks every column up by name).
+
+    cursor.description is the same object for every row of a statement, so the
+    column names are extracted once per query and reused for the rest of its rows.
+    """
+    description = cursor.description
+    cached = getattr(_local, "row_fields", None)
+    if cached is None or cached[0] is not description:
+        cached = (description, tuple(col[0] for col in description))
+        _local.row_fields = cached
+    return dict(zip(cached[1], row))
+
+
 def _connect() -> sqlite3.Connection:
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL")
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect(DB_PATH, cached_statements=_CACHED_STATEMENTS)
+        conn.row_factory = _dict_row
+        conn.executescript(_CONNECTION_PRAGMAS)
+        _local.conn = conn
     return conn
 
 
+# Stored in the database's user_version once init_db has brought it up to date.
+# Bump it whenever the schema below changes, so existing databases migrate.
+SCHEMA_VERSION = 2
+
+
 def init_db():
-    """Create the tables if they don't exist, and migrate existing ones."""
+    """Create the tables if they don't exist, and migrate existing ones.
+
+    A database already at SCHEMA_VERSION is left alone, so the common startup
+    is a single PRAGMA read.
+    """
     conn = _connect()
+    if conn.execute("PRAGMA user_version").fetchone()["user_version"] >= SCHEMA_VERSION:
+        return
+    conn.execute("PRAGMA journal_mode=WAL")
     conn.executescript("""
         CREATE TABLE IF NOT EXISTS jobs (
             id               INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -40,25 +103,18 @@ def init_db():
             apply_deadline   TEXT,
             description      TEXT,
             score            INTEGER DEFAULT 0,
-            created_at       TEXT DEFAULT (datetime('now'))
-        );
-
-        CREATE TABLE IF NOT EXISTS applications (
-            id           INTEGER PRIMARY KEY AUTOINCREMENT,
-            job_id       INTEGER NOT NULL REFERENCES jobs(id),
-            status       TEXT NOT NULL DEFAULT 'saved',
-            notes        TEXT,
-            applied_at   TEXT,
-            followed_up  TEXT,
-            interview_at TEXT,
-            updated_at   TEXT DEFAULT (datetime('now')),
-            UNIQUE(job_id)
+            created_at       TEXT DEFAULT (datetime('now')),
+            source_lc        TEXT GENERATED ALWAYS AS (lower(source)) VIRTUAL,
+            company_lc       TEXT GENERATED ALWAYS AS (lower(company)) VIRTUAL
         );
     """)
+    conn.execute(_applications_ddl("applications"))
+    _migrate_status_check(conn)
 
     # Migrate: add new columns to existing tables if they don't exist yet
+    # (table_xinfo, unlike table_info, also lists generated columns)
     existing = {
-        row[1] for row in conn.execute("PRAGMA table_info(jobs)").fetchall()
+        row["name"] for row in conn.execute("PRAGMA table_xinfo(jobs)").fetchall()
     }
     migrations = {
         "salary_min":       "ALTER TABLE jobs ADD COLUMN salary_min TEXT",
@@ -67,13 +123,201 @@ def init_db():
         "is_remote":        "ALTER TABLE jobs ADD COLUMN is_remote INTEGER DEFAULT 0",
         "experience_level": "ALTER TABLE jobs ADD COLUMN experience_level TEXT",
         "apply_deadline":   "ALTER TABLE jobs ADD COLUMN apply_deadline TEXT",
+        # Lowercased copies for case-insensitive filters/sorts that can use an index
+        "source_lc":        "ALTER TABLE jobs ADD COLUMN source_lc TEXT "
+                            "GENERATED ALWAYS AS (lower(source)) VIRTUAL",
+        "company_lc":       "ALTER TABLE jobs ADD COLUMN company_lc TEXT "
+                            "GENERATED ALWAYS AS (lower(company)) VIRTUAL",
     }
     for col, sql in migrations.items():
         if col not in existing:
             conn.execute(sql)
 
+    conn.executescript("""
+        CREATE INDEX IF NOT EXISTS idx_jobs_score ON jobs(score DESC, created_at DESC);
+        CREATE INDEX IF NOT EXISTS idx_jobs_source ON jobs(source);
+        CREATE INDEX IF NOT EXISTS idx_jobs_source_lc ON jobs(source_lc, score DESC);
+        CREATE INDEX IF NOT EXISTS idx_jobs_company_lc ON jobs(company_lc);
+        CREATE INDEX IF NOT EXISTS idx_jobs_date_posted ON jobs(date_posted);
+        CREATE INDEX IF NOT EXISTS idx_applications_status_updated
+            ON applications(status, updated_at DESC);
+        CREATE INDEX IF NOT EXISTS idx_applications_updated
+            ON applications(updated_at DESC);
+    """)
+
+    _init_stats_cache(conn)
+    _init_fts(conn)
+
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
     conn.commit()
-    conn.close()
+
+    # Give the planner row-count and selectivity stats for the indexes above;
+    # save_jobs keeps them current as the table grows
+    if not conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+    ).fetchone():
+        conn.execute("ANALYZE")
+
+
+def _applications_ddl(table: str) -> str:
+    """CREATE TABLE statement for the applications table (named table).
+
+    The CHECK mirrors VALID_STATUSES; adding a status needs a SCHEMA_VERSION
+    bump and a rebuild like _migrate_status_check's.
+    """
+    statuses = ", ".join(f"'{s}'" for s in VALID_STATUSES)
+    return f"""
+        CREATE TABLE IF NOT EXISTS {table} (
+            id           INTEGER PRIMARY KEY AUTOINCREMENT,
+            job_id       INTEGER NOT NULL REFERENCES jobs(id),
+            status       TEXT NOT NULL DEFAULT 'saved' CHECK (status IN ({statuses})),
+            notes        TEXT,
+            applied_at   TEXT,
+            followed_up  TEXT,
+            interview_at TEXT,
+            updated_at   TEXT DEFAULT (datetime('now')),
+            UNIQUE(job_id)
+        )"""
+
+
+def _migrate_status_check(conn: sqlite3.Connection) -> None:
+    """Rebuild an applications table created before the status CHECK constraint.
+
+    SQLite can't add a constraint to an existing table, so the rows are copied
+    into a new one. The old table's indexes and triggers are dropped with it;
+    init_db recreates them right after. Any status outside VALID_STATUSES
+    (only possible through raw SQL) becomes 'saved'.
+    """
+    sql = conn.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'applications'"
+    ).fetchone()["sql"]
+    if "CHECK" in sql:
+        return
+    statuses = ", ".join(f"'{s}'" for s in VALID_STATUSES)
+    has_stats = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'stats_cache'"
+    ).fetchone()
+    conn.execute("BEGIN")
+    with conn:
+        conn.execute(_applications_ddl("applications_new"))
+        conn.execute(
+            f"""INSERT INTO applications_new
+                   (id, job_id, status, notes, applied_at, followed_up,
+                    interview_at, updated_at)
+               SELECT id, job_id,
+                      CASE WHEN status IN ({statuses}) THEN status ELSE 'saved' END,
+                      notes, applied_at, followed_up, interview_at, updated_at
+               FROM applications"""
+        )
+        conn.execute("DROP TABLE applications")
+        conn.execute("ALTER TABLE applications_new RENAME TO applications")
+        if has_stats:
+            # Recount in case any status was rewritten above
+            conn.execute("DELETE FROM stats_cache WHERE metric != 'total_jobs_found'")
+            conn.execute(
+                """INSERT INTO stats_cache (metric, n)
+                   SELECT status, COUNT(*) FROM applications GROUP BY status"""
+            )
+
+
+def _init_stats_cache(conn: sqlite3.Connection) -> None:
+    """Create the stats_cache table and the triggers that keep it current.
+
+    stats_cache holds one counter per metric: "total_jobs_found" plus one per
+    application status. Triggers update it on every write, so get_stats() is a
+    single small table read and stays correct no matter which process writes.
+    """
+    created = not conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'stats_cache'"
+    ).fetchone()
+    conn.executescript("""
+        CREATE TABLE IF NOT EXISTS stats_cache (
+            metric TEXT PRIMARY KEY,
+            n      INTEGER NOT NULL DEFAULT 0
+        );
+
+        CREATE TRIGGER IF NOT EXISTS trg_jobs_insert_stats AFTER INSERT ON jobs
+        BEGIN
+            INSERT INTO stats_cache (metric, n) VALUES ('total_jobs_found', 1)
+            ON CONFLICT(metric) DO UPDATE SET n = n + 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_jobs_delete_stats AFTER DELETE ON jobs
+        BEGIN
+            UPDATE stats_cache SET n = n - 1 WHERE metric = 'total_jobs_found';
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_apps_insert_stats AFTER INSERT ON applications
+        BEGIN
+            INSERT INTO stats_cache (metric, n) VALUES (NEW.status, 1)
+            ON CONFLICT(metric) DO UPDATE SET n = n + 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_apps_update_stats
+        AFTER UPDATE OF status ON applications
+        WHEN OLD.status != NEW.status
+        BEGIN
+            UPDATE stats_cache SET n = n - 1 WHERE metric = OLD.status;
+            INSERT INTO stats_cache (metric, n) VALUES (NEW.status, 1)
+            ON CONFLICT(metric) DO UPDATE SET n = n + 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_apps_delete_stats AFTER DELETE ON applications
+        BEGIN
+            UPDATE stats_cache SET n = n - 1 WHERE metric = OLD.status;
+        END;
+    """)
+    if created:
+        # Backfill from the existing rows; the triggers take over from here
+        conn.execute(
+            """INSERT INTO stats_cache (metric, n)
+               SELECT 'total_jobs_found', COUNT(*) FROM jobs
+               UNION ALL
+               SELECT status, COUNT(*) FROM applications GROUP BY status"""
+        )
+
+
+def _init_fts(conn: sqlite3.Connection) -> None:
+    """Create the jobs_fts full-text index over title/company/description.
+
+    It is an external-content FTS5 table (no duplicate copy of the text) kept in
+    sync by triggers. The trigram tokenizer makes a quoted query match any
+    substring, case-insensitively — the same results as the old LIKE '%kw%'
+    scan, but answered from the index.
+    """
+    created = not conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs_fts'"
+    ).fetchone()
+    conn.executescript("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+            title, company, description,
+            content='jobs', content_rowid='id', tokenize='trigram'
+        );
+
+        CREATE TRIGGER IF NOT EXISTS trg_jobs_fts_insert AFTER INSERT ON jobs
+        BEGIN
+            INSERT INTO jobs_fts (rowid, title, company, description)
+            VALUES (NEW.id, NEW.title, NEW.company, NEW.description);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_jobs_fts_delete AFTER DELETE ON jobs
+        BEGIN
+            INSERT INTO jobs_fts (jobs_fts, rowid, title, company, description)
+            VALUES ('delete', OLD.id, OLD.title, OLD.company, OLD.description);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_jobs_fts_update
+        AFTER UPDATE OF title, company, description ON jobs
+        BEGIN
+            INSERT INTO jobs_fts (jobs_fts, rowid, title, company, description)
+            VALUES ('delete', OLD.id, OLD.title, OLD.company, OLD.description);
+            INSERT INTO jobs_fts (rowid, title, company, description)
+            VALUES (NEW.id, NEW.title, NEW.company, NEW.description);
+        END;
+    """)
+    if created:
+        # Index the rows that existed before the FTS table did
+        conn.execute("INSERT INTO jobs_fts (jobs_fts) VALUES ('rebuild')")
 
 
 # ── Jobs ─────────────────────────────────────────────────────────────────────
@@ -89,96 +333,248 @@ def _clean_url(url: str) -> str:
         return url
 
 
+def _job_row(job: dict) -> tuple:
+    return (
+        job["title"],
+        job["company"],
+        job["location"],
+        _clean_url(job["url"]),
+        job["date_posted"],
+        job["source"],
+        job.get("salary", ""),
+        job.get("salary_min", ""),
+        job.get("salary_max", ""),
+        job.get("employment_type", ""),
+        1 if job.get("is_remote") else 0,
+        job.get("experience_level", ""),
+        job.get("apply_deadline", ""),
+        job.get("description", ""),
+        job.get("score", 0),
+    )
+
+
 def save_jobs(jobs: list[dict]) -> int:
     """Insert jobs into the database. Returns count of newly added jobs."""
     conn = _connect()
-    added = 0
-    for job in jobs:
-        try:
-            conn.execute(
-                """INSERT OR IGNORE INTO jobs
-                   (title, company, location, url, date_posted, source,
-                    salary, salary_min, salary_max,
-                    employment_type, is_remote, experience_level, apply_deadline,
-                    description, score)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    job["title"],
-                    job["company"],
-                    job["location"],
-                    _clean_url(job["url"]),
-                    job["date_posted"],
-                    job["source"],
-                    job.get("salary", ""),
-                    job.get("salary_min", ""),
-                    job.get("salary_max", ""),
-                    job.get("employment_type", ""),
-                    1 if job.get("is_remote") else 0,
-                    job.get("experience_level", ""),
-                    job.get("apply_deadline", ""),
-                    job.get("description", ""),
-                    job.get("score", 0),
-                ),
-            )
-            if conn.total_changes:
-                added += 1
-        except sqlite3.IntegrityError:
-            pass
-    conn.commit()
-    conn.close()
+    rows = [_job_row(job) for job in jobs]
+    # One statement and one transaction for the whole batch. OR IGNORE skips
+    # duplicate URLs (and NOT NULL violations) silently, so nothing raises.
+    with conn:
+        cur = conn.executemany(
+            """INSERT OR IGNORE INTO jobs
+               (title, company, location, url, date_posted, source,
+                salary, salary_min, salary_max,
+                employment_type, is_remote, experience_level, apply_deadline,
+                description, score)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            rows,
+        )
+    # rowcount sums over all rows; ignored duplicates add 0
+    added = cur.rowcount
+    if added >= ANALYZE_MIN_NEW_ROWS:
+        conn.execute("ANALYZE jobs")
+    if added:
+        _invalidate_sources()
+        _invalidate_stats()
+        _invalidate_jobs()
     return added
 
 
-def get_jobs(limit: int = 50, min_score: int = 0) -> list[dict]:
-    """Retrieve saved jobs, sorted by score."""
+# ORDER BY clauses for the sort keys the web UI offers. Ties fall back to score.
+JOB_SORTS = {
+    "score":    "j.score DESC, j.created_at DESC",
+    "date":     "j.date_posted DESC, j.score DESC",
+    "company":  "j.company_lc, j.score DESC",
+    # Jobs with no deadline go to the end; soonest deadline first
+    "deadline": "COALESCE(NULLIF(j.apply_deadline, ''), '9999-99-99'), j.score DESC",
+}
+
+
+def _job_filters(
+    status: str | None, is_remote: bool | None, source: str | None
+) -> tuple[str, list]:
+    """Build extra WHERE conditions (each prefixed with AND) and their params."""
+    where, params = "", []
+    if status:
+        where += " AND COALESCE(a.status, 'saved') = ?"
+        params.append(status)
+    if is_remote:
+        where += " AND j.is_remote = 1"
+    if source:
+        where += " AND j.source_lc = ?"
+        params.append(source.lower())
+    return where, params
+
+
+# Columns for job lists (dashboard, CLI tables, export). get_job() adds the
+# description, often most of a row's size. The internal _lc columns are never
+# returned.
+_JOB_LIST_COLUMNS = """j.id, j.title, j.company, j.location, j.url, j.date_posted,
+                  j.source, j.salary, j.salary_min, j.salary_max, j.employment_type,
+                  j.is_remote, j.experience_level, j.apply_deadline, j.score,
+                  j.created_at"""
+
+
+# The dashboard re-requests the same job list on every refresh. Writes from this
+# process clear the cache immediately, the TTL bounds staleness from writes made
+# by another process. Only limited lists are cached, so entries stay small.
+# Cached rows are private: every caller gets its own dict copies, so editing a
+# returned row never changes what later calls see.
+JOBS_CACHE_TTL = 5  # seconds
+_JOBS_CACHE_MAX_ENTRIES = 64
+_jobs_cache: dict[tuple, tuple[float, list[dict]]] = {}
+
+
+def _invalidate_jobs() -> None:
+    _jobs_cache.clear()
+
+
+def get_jobs(
+    limit: int | None = 50,
+    min_score: int = 0,
+    status: str | None = None,
+    is_remote: bool | None = None,
+    source: str | None = None,
+    sort: str = "score",
+) -> list[dict]:
+    """Retrieve saved jobs, filtered and sorted in SQL (by score by default).
+
+    Pass limit=None to get every matching job. The returned dicts are the
+    caller's own and may be modified.
+    """
+    key = (limit, min_score, status, bool(is_remote), source, sort)
+    now = time.monotonic()
+    cached = _jobs_cache.get(key)
+    if cached and now - cached[0] < JOBS_CACHE_TTL:
+        return [dict(r) for r in cached[1]]
+    where, params = _job_filters(status, is_remote, source)
+    order = JOB_SORTS.get(sort, JOB_SORTS["score"])
+    limit_sql = ""
+    if limit is not None:
+        limit_sql = "\n           LIMIT ?"
+        params.append(limit)
     conn = _connect()
     rows = conn.execute(
-        """SELECT j.*, a.status as app_status, a.notes as app_notes
+        f"""SELECT {_JOB_LIST_COLUMNS},
+                  a.status as app_status, a.notes as app_notes
            FROM jobs j
            LEFT JOIN applications a ON a.job_id = j.id
-           WHERE j.score >= ?
-           ORDER BY j.score DESC, j.created_at DESC
-           LIMIT ?""",
-        (min_score, limit),
+           WHERE j.score >= ?{where}
+           ORDER BY {order}{limit_sql}""",
+        (min_score, *params),
     ).fetchall()
-    conn.close()
-    return [dict(r) for r in rows]
+    if limit is not None:
+        if len(_jobs_cache) >= _JOBS_CACHE_MAX_ENTRIES:
+            _jobs_cache.clear()
+        _jobs_cache[key] = (now, rows)
+        return [dict(r) for r in rows]
+    return rows
+
+
+def iter_jobs() -> Iterator[dict]:
+    """Yield every saved job, best score first, without building a list of them."""
+    conn = _connect()
+    yield from conn.execute(
+        f"""SELECT {_JOB_LIST_COLUMNS},
+                  a.status as app_status, a.notes as app_notes
+           FROM jobs j
+           LEFT JOIN applications a ON a.job_id = j.id
+           ORDER BY {JOB_SORTS["score"]}"""
+    )
+
+
+def iter_job_texts() -> Iterator[dict]:
+    """Yield just id, title and description for every job (for re-extracting
+    details), skipping the applications join and the other columns."""
+    conn = _connect()
+    yield from conn.execute(
+        "SELECT id, title, COALESCE(description, '') AS description FROM jobs"
+    )
 
 
 def get_job(job_id: int) -> dict | None:
     """Get a single job by ID with full details."""
     conn = _connect()
     row = conn.execute(
-        """SELECT j.*, a.status as app_status, a.notes as app_notes,
+        f"""SELECT {_JOB_LIST_COLUMNS}, j.description,
+                  a.status as app_status, a.notes as app_notes,
                   a.applied_at, a.followed_up, a.interview_at
            FROM jobs j
            LEFT JOIN applications a ON a.job_id = j.id
            WHERE j.id = ?""",
         (job_id,),
     ).fetchone()
-    conn.close()
-    return dict(row) if row else None
-
-
-def search_jobs_db(keyword: str) -> list[dict]:
-    """Search saved jobs by keyword."""
+    return row
+
+
+def search_jobs_db(
+    keyword: str,
+    limit: int | None = None,
+    min_score: int = 0,
+    status: str | None = None,
+    is_remote: bool | None = None,
+    source: str | None = None,
+    sort: str = "score",
+) -> list[dict]:
+    """Search saved jobs by keyword (substring match on title, company, description)."""
+    where, params = _job_filters(status, is_remote, source)
+    order = JOB_SORTS.get(sort, JOB_SORTS["score"])
+    limit_sql = ""
+    if limit is not None:
+        limit_sql = "\n           LIMIT ?"
+        params.append(limit)
     conn = _connect()
-    pattern = f"%{keyword}%"
+    if len(keyword) >= 3:
+        # Quoted so the keyword is matched as one literal phrase, not FTS syntax
+        match = '"' + keyword.replace('"', '""') + '"'
+        condition = "j.id IN (SELECT rowid FROM jobs_fts WHERE jobs_fts MATCH ?)"
+        match_params = (match,)
+    else:
+        # Trigrams can't index keywords shorter than 3 characters
+        pattern = f"%{keyword}%"
+        condition = "(j.title LIKE ? OR j.company LIKE ? OR j.description LIKE ?)"
+        match_params = (pattern, pattern, pattern)
     rows = conn.execute(
-        """SELECT j.*, a.status as app_status
+        f"""SELECT {_JOB_LIST_COLUMNS}, a.status as app_status
            FROM jobs j
            LEFT JOIN applications a ON a.job_id = j.id
-           WHERE j.title LIKE ? OR j.company LIKE ? OR j.description LIKE ?
-           ORDER BY j.score DESC""",
-        (pattern, pattern, pattern),
+           WHERE {condition} AND j.score >= ?{where}
+           ORDER BY {order}{limit_sql}""",
+        (*match_params, min_score, *params),
+    ).fetchall()
+    return rows
+
+
+# Distinct sources change only when new jobs are saved, so cache them briefly.
+# The TTL covers writes made by another process (e.g. the CLI).
+SOURCES_CACHE_TTL = 60  # seconds
+_sources_cache: tuple[float, list[str]] | None = None
+
+
+def _invalidate_sources() -> None:
+    global _sources_cache
+    _sources_cache = None
+
+
+def get_distinct_sources() -> list[str]:
+    """Return the sorted list of distinct job sources (cached for a short TTL)."""
+    global _sources_cache
+    now = time.monotonic()
+    if _sources_cache and now - _sources_cache[0] < SOURCES_CACHE_TTL:
+        return _sources_cache[1]
+    conn = _connect()
+    rows = conn.execute(
+        "SELECT DISTINCT source FROM jobs WHERE source IS NOT NULL AND source != ''"
     ).fetchall()
-    conn.close()
-    return [dict(r) for r in rows]
+    sources = sorted(r["source"] for r in rows)
+    _sources_cache = (now, sources)
+    return sources
 
 
 # ── Applications ─────────────────────────────────────────────────────────────
 
-VALID_STATUSES = [
+# Ordered for display (CLI choices, web UI dropdowns)
+VALID_STATUSES = (
     "saved",        # Found, not yet applied
     "applied",      # Application submitted
     "followed_up",  # Sent a follow-up
@@ -187,42 +583,64 @@ VALID_STATUSES = [
     "rejected",     # Got rejected
     "declined",     # Declined by me
     "withdrawn",    # Withdrew application
-]
+)
+# Set form for O(1) validation
+VALID_STATUS_SET = frozenset(VALID_STATUSES)
+
+
+# Upsert one application: the milestone timestamp matching the new status is set
+# to now (?4), the other two keep their stored values (NULL on a new row).
+_SET_STATUS_SQL = """INSERT INTO applications
+           (job_id, status, notes, updated_at,
+            applied_at, followed_up, interview_at)
+       VALUES (?1, ?2, ?3, ?4,
+               CASE ?2 WHEN 'applied' THEN ?4 END,
+               CASE ?2 WHEN 'followed_up' THEN ?4 END,
+               CASE ?2 WHEN 'interview' THEN ?4 END)
+       ON CONFLICT(job_id) DO UPDATE SET
+           status = excluded.status,
+           notes = COALESCE(NULLIF(excluded.notes, ''), applications.notes),
+           updated_at = excluded.updated_at,
+           applied_at = COALESCE(excluded.applied_at, applications.applied_at),
+           followed_up = COALESCE(excluded.followed_up, applications.followed_up),
+           interview_at = COALESCE(excluded.interview_at, applications.interview_at)"""
 
 
 def set_status(job_id: int, status: str, notes: str = "") -> bool:
     """Set application status for a job."""
-    if status not in VALID_STATUSES:
+    if status not in VALID_STATUS_SET:
         return False
     conn = _connect()
     now = datetime.now().isoformat()
+    with conn:
+        conn.execute(_SET_STATUS_SQL, (job_id, status, notes, now))
 
-    conn.execute(
-        """INSERT INTO applications (job_id, status, notes, updated_at)
-           VALUES (?, ?, ?, ?)
-           ON CONFLICT(job_id) DO UPDATE SET
-               status = excluded.status,
-               notes = CASE WHEN excluded.notes != '' THEN excluded.notes ELSE applications.notes END,
-               updated_at = excluded.updated_at""",
-        (job_id, status, notes, now),
-    )
+    _invalidate_stats()
+    _invalidate_jobs()
+    return True
 
-    if status == "applied":
-        conn.execute(
-            "UPDATE applications SET applied_at = ? WHERE job_id = ?", (now, job_id)
-        )
-    elif status == "followed_up":
-        conn.execute(
-            "UPDATE applications SET followed_up = ? WHERE job_id = ?", (now, job_id)
-        )
-    elif status == "interview":
-        conn.execute(
-            "UPDATE applications SET interview_at = ? WHERE job_id = ?", (now, job_id)
-        )
 
-    conn.commit()
-    conn.close()
-    return True
+def set_statuses(items: list[tuple[int, str, str]]) -> int:
+    """Set application status for many jobs in one transaction.
+
+    Each entry is (job_id, status, notes). Entries with an invalid status are
+    skipped. Returns the number of entries applied.
+    """
+    now = datetime.now().isoformat()
+    rows = [
+        (job_id, status, notes, now)
+        for job_id, status, notes in items
+        if status in VALID_STATUS_SET
+    ]
+    if not rows:
+        return 0
+    conn = _connect()
+    with conn:
+        conn.executemany(_SET_STATUS_SQL, rows)
+
+    _invalidate_stats()
+    _invalidate_jobs()
+    return len(rows)
 
 
 def get_applications(status: str | None = None) -> list[dict]:
@@ -248,31 +666,71 @@ def get_applications(status: str | None = None) -> list[dict]:
                JOIN jobs j ON j.id = a.job_id
                ORDER BY a.updated_at DESC""",
         ).fetchall()
-    conn.close()
-    return [dict(r) for r in rows]
+    return rows
+
+
+# Columns update_job_fields may set (not id or the generated _lc columns)
+UPDATABLE_JOB_FIELDS = frozenset({
+    "title", "company", "location", "url", "date_posted", "source",
+    "salary", "salary_min", "salary_max", "employment_type", "is_remote",
+    "experience_level", "apply_deadline", "description", "score", "created_at",
+})
+
+
+@functools.lru_cache(maxsize=64)
+def _update_fields_sql(cols: tuple[str, ...]) -> str:
+    return "UPDATE jobs SET " + ", ".join(f"{c} = ?" for c in cols) + " WHERE id = ?"
 
 
 def update_job_fields(job_id: int, fields: dict) -> None:
-    """Update specific fields on an existing job row."""
+    """Update specific fields on an existing job row in one statement.
+
+    Names that aren't updatable job columns are ignored.
+    """
+    fields = {k: v for k, v in fields.items() if k in UPDATABLE_JOB_FIELDS}
+    if not fields:
+        return
     conn = _connect()
-    for col, val in fields.items():
-        try:
-            conn.execute(f"UPDATE jobs SET {col} = ? WHERE id = ?", (val, job_id))
-        except Exception:
-            pass
-    conn.commit()
-    conn.close()
+    with conn:
+        conn.execute(_update_fields_sql(tuple(fields)), (*fields.values(), job_id))
+    _invalidate_jobs()
+
+
+def update_job_details(updates: list[tuple[str, str, int]]) -> None:
+    """Set (apply_deadline, experience_level) for many jobs in one transaction.
+
+    Each entry is (apply_deadline, experience_level, job_id).
+    """
+    conn = _connect()
+    with conn:
+        conn.executemany(
+            "UPDATE jobs SET apply_deadline = ?, experience_level = ? WHERE id = ?",
+            updates,
+        )
+    _invalidate_jobs()
+
+
+# Stats are polled by the dashboard; writes from this process clear the cache
+# immediately, the TTL bounds staleness from writes made by another process.
+STATS_CACHE_TTL = 5  # seconds
+_stats_cache: tuple[float, dict] | None = None
+
+
+def _invalidate_stats() -> None:
+    global _stats_cache
+    _stats_cache = None
 
 
 def get_stats() -> dict:
-    """Get summary statistics of all applications."""
+    """Get summary statistics of all applications (read from stats_cache)."""
+    global _stats_cache
+    now = time.monotonic()
+    if _stats_cache and now - _stats_cache[0] < STATS_CACHE_TTL:
+        return dict(_stats_cache[1])
     conn = _connect()
-    total_jobs = conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
-    rows = conn.execute(
-        "SELECT status, COUNT(*) as cnt FROM applications GROUP BY status"
-    ).fetchall()
-    conn.close()
-    stats = {"total_jobs_found": total_jobs}
+    rows = conn.execute("SELECT metric, n FROM stats_cache WHERE n > 0").fetchall()
+    stats = {"total_jobs_found": 0}
     for r in rows:
-        stats[r["status"]] = r["cnt"]
-    return stats
+        stats[r["metric"]] = r["n"]
+    _stats_cache = (now, stats)
+    return dict(stats)